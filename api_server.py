@@ -1,35 +1,73 @@
 from fastapi import (
     FastAPI,
     HTTPException,
-    UploadFile,
-    File,
-    Form,
     Depends,
     Header,
     status,
     Request,
 )
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+from typing import Optional, List, Dict, Any, Set, Tuple
 import uvicorn
 import asyncio
-import base64
 import io
 import os
 import tempfile
 import json
 import time
+import uuid
 from datetime import datetime, timedelta
-from collections import defaultdict
-import threading
+from collections import OrderedDict
+from functools import lru_cache
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+import heapq
+import importlib.util
+import itertools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import anyio
+import anyio.to_thread
+
+try:
+    # pybase64 is a SIMD drop-in for the stdlib base64 functions used here
+    import pybase64 as base64
+
+    BASE64_BACKEND = f"pybase64 {base64.get_version()}"
+    b64encode_as_string = base64.b64encode_as_string
+except ImportError:
+    import base64
+
+    BASE64_BACKEND = "stdlib"
+
+    def b64encode_as_string(data: bytes) -> str:
+        # Base64 output is pure ASCII, which decodes faster than UTF-8
+        return base64.b64encode(data).decode("ascii")
+
+
+try:
+    # orjson encodes the large base64 screenshot payloads much faster
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+
+    def ndjson_line(event: Dict[str, Any]) -> bytes:
+        """Encode one NDJSON event, newline included"""
+        return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultJSONResponse
+
+    def ndjson_line(event: Dict[str, Any]) -> bytes:
+        """Encode one NDJSON event, newline included"""
+        return (json.dumps(event) + "\n").encode()
+
 
 from os_computer_use.streaming import Sandbox
-from os_computer_use.api_agent import APISandboxAgent
-from os_computer_use.demo_agent import DemoAgent
-from os_computer_use.demo_orchestrator import DemoOrchestrator
-from os_computer_use.logging import Logger
+from os_computer_use.logging import Logger, logger as agent_logger
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -38,33 +76,82 @@ os.environ["E2B_API_KEY"] = os.getenv("E2B_API_KEY")
 
 # Security Configuration
 API_KEY = os.getenv("API_KEY")  # Add this to your Railway environment
-ALLOWED_ORIGINS = (
-    os.getenv("ALLOWED_ORIGINS", "").split(",")
-    if os.getenv("ALLOWED_ORIGINS")
-    else ["*"]
-)
+# Set of allowed origins, so the CORS middleware's check is a hash lookup
+ALLOWED_ORIGINS = frozenset(
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "").split(",")
+    if origin.strip()
+) or frozenset({"*"})
 RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", "10"))
 REQUEST_TIMEOUT_SECONDS = int(os.getenv("REQUEST_TIMEOUT_SECONDS", "300"))  # 5 minutes
 SANDBOX_MAX_LIFETIME_MINUTES = int(os.getenv("SANDBOX_MAX_LIFETIME_MINUTES", "30"))
+SCREENSHOT_CACHE_SIZE = int(os.getenv("SCREENSHOT_CACHE_SIZE", "8"))
+SCREENSHOT_MAX_AGE_SECONDS = float(os.getenv("SCREENSHOT_MAX_AGE_SECONDS", "1"))
+SANDBOX_POOL_SIZE = int(os.getenv("SANDBOX_POOL_SIZE", "2"))
+MAX_AGENT_SESSIONS = int(os.getenv("MAX_AGENT_SESSIONS", "8"))
+# Clients exempt from rate limiting (e.g. health checks)
+TRUSTED_IPS = frozenset(
+    ip.strip() for ip in os.getenv("TRUSTED_IPS", "").split(",") if ip.strip()
+)
+REDIS_URL = os.getenv("REDIS_URL")  # Share rate limits across workers
 
-app = FastAPI(title="Computer Use Agent API", version="1.0.0")
+app = FastAPI(
+    title="Computer Use Agent API",
+    version="1.0.0",
+    default_response_class=DefaultJSONResponse,
+)
 
 # Security: HTTPBearer for API key authentication
 security = HTTPBearer(auto_error=False)
 
-# Rate limiting storage
-rate_limit_storage = defaultdict(list)
-rate_limit_lock = threading.Lock()
-
-# Sandbox cleanup tracking
+# Rate limiting storage: per-IP token bucket of (tokens, last_refill).
+# Only touched from the event loop with no await in between read and write,
+# so no lock is needed.
+RATE_LIMIT_CAPACITY = float(RATE_LIMIT_PER_MINUTE)
+RATE_LIMIT_REFILL_PER_SECOND = RATE_LIMIT_PER_MINUTE / 60.0
+rate_limit_storage: Dict[str, Tuple[float, float]] = {}
+
+# With REDIS_URL set, rate limits are a fixed one-minute window counted
+# atomically in Redis so every worker process sees the same count
+RATE_LIMIT_LUA = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], 60)
+end
+return count
+"""
+if REDIS_URL:
+    import redis.asyncio as redis_asyncio
+
+    redis_client = redis_asyncio.from_url(REDIS_URL)
+    rate_limit_script = redis_client.register_script(RATE_LIMIT_LUA)
+else:
+    redis_client = None
+    rate_limit_script = None
+
+# Output directories: one base per server process, numbered runs inside it
+OUTPUT_RUN_BASE = f"./output/server_{int(time.time())}_{os.getpid()}"
+os.makedirs(OUTPUT_RUN_BASE, exist_ok=True)
+output_run_counter = itertools.count(1)
+
+# Recent screenshots served as raw PNG from /screenshot/{id}.png
+screenshot_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+# Sandbox cleanup tracking (sandbox_created_at is a time.monotonic() reading).
+# A single background loop pops (expiry, seq, sandbox_ref) entries off the heap.
+CLEANUP_INTERVAL_SECONDS = 30
 sandbox_created_at = None
-cleanup_timer = None
+cleanup_heap: List[Tuple[float, int, weakref.ref]] = []
+cleanup_sequence = itertools.count()
+cleanup_task = None
 
 # Add CORS middleware with restricted origins
 app.add_middleware(
     CORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,  # Restricted to specific domains
-    allow_credentials=True,
+    # Browsers reject credentials with a wildcard origin, and auth is a
+    # bearer header anyway, so only allow them for explicit origins
+    allow_credentials="*" not in ALLOWED_ORIGINS,
     allow_methods=["GET", "POST"],  # Only necessary methods
     allow_headers=["Authorization", "Content-Type"],  # Specific headers only
 )
@@ -72,85 +159,170 @@ app.add_middleware(
 # Global variables for sandbox and agent
 sandbox = None
 agent = None
+init_lock = asyncio.Lock()
 logger = Logger()
 
+# Blocking agent calls run in worker threads, one at a time since the
+# agent's conversation state is shared
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "64"))
+agent_lock = asyncio.Lock()
+
+# Bumped after every agent action; a screenshot taken in the same epoch and
+# younger than SCREENSHOT_MAX_AGE_SECONDS is reused instead of grabbed again.
+# latest_screenshot is (epoch, taken_at, png_bytes).
+action_epoch = 0
+latest_screenshot: Optional[Tuple[int, float, bytes]] = None
+
+# Warm pool of booted sandboxes so requests don't pay the cold start
+sandbox_pool: asyncio.Queue = asyncio.Queue()
+sandbox_pool_refilling = False
+
+# Fire-and-forget tasks, referenced until done so they aren't garbage
+# collected mid-run
+background_tasks: Set[asyncio.Task] = set()
+
 
 # Security Functions
-def verify_api_key(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-):
-    """Verify API key authentication"""
-    if not API_KEY:
-        # If no API key is set, allow access (for backward compatibility)
+MISSING_API_KEY_ERROR = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Missing API key",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+INVALID_API_KEY_ERROR = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid API key",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+if not API_KEY:
+    # If no API key is set, allow access (for backward compatibility) and
+    # skip the HTTPBearer dependency entirely
+    def verify_api_key():
+        """Verify API key authentication (disabled, no API key configured)"""
         return True
 
-    if not credentials:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing API key",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+else:
 
-    if credentials.credentials != API_KEY:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid API key",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    def verify_api_key(
+        credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    ):
+        """Verify API key authentication"""
+        if not credentials:
+            # Drop the traceback from any previous raise of the shared instance
+            raise MISSING_API_KEY_ERROR.with_traceback(None)
 
-    return True
+        if credentials.credentials != API_KEY:
+            raise INVALID_API_KEY_ERROR.with_traceback(None)
 
+        return True
+
+
+async def rate_limit_check(client_ip: str = None) -> int:
+    """Check rate limiting per IP using a token bucket
 
-def rate_limit_check(client_ip: str = None):
-    """Check rate limiting per IP"""
+    Returns the number of requests remaining for the client.
+    """
     if not client_ip:
         client_ip = "unknown"
 
-    with rate_limit_lock:
-        current_time = time.time()
-        # Clean old entries (older than 1 minute)
-        rate_limit_storage[client_ip] = [
-            timestamp
-            for timestamp in rate_limit_storage[client_ip]
-            if current_time - timestamp < 60
-        ]
-
-        # Check if rate limit exceeded
-        if len(rate_limit_storage[client_ip]) >= RATE_LIMIT_PER_MINUTE:
+    if rate_limit_script is not None:
+        request_count = await rate_limit_script(keys=[f"rate_limit:{client_ip}"])
+        if request_count > RATE_LIMIT_PER_MINUTE:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail=f"Rate limit exceeded. Max {RATE_LIMIT_PER_MINUTE} requests per minute.",
             )
+        return RATE_LIMIT_PER_MINUTE - request_count
+
+    now = time.monotonic()
+    tokens, last_refill = rate_limit_storage.get(client_ip, (RATE_LIMIT_CAPACITY, now))
+    # Refill tokens for the time elapsed since the last request
+    tokens = min(
+        RATE_LIMIT_CAPACITY,
+        tokens + (now - last_refill) * RATE_LIMIT_REFILL_PER_SECOND,
+    )
+
+    # Check if rate limit exceeded
+    if tokens < 1:
+        rate_limit_storage[client_ip] = (tokens, now)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Rate limit exceeded. Max {RATE_LIMIT_PER_MINUTE} requests per minute.",
+        )
+
+    # Consume a token for the current request
+    tokens -= 1
+    rate_limit_storage[client_ip] = (tokens, now)
+    return int(tokens)
+
 
-        # Add current request
-        rate_limit_storage[client_ip].append(current_time)
+async def rate_limit_dep(request: Request) -> str:
+    """Resolve the client IP and apply rate limiting, returning the IP"""
+    client_ip = request.client.host if request.client else "unknown"
+    if client_ip in TRUSTED_IPS:
+        return client_ip
+
+    request.state.rate_limit_remaining = await rate_limit_check(client_ip)
+    return client_ip
+
+
+@contextmanager
+def endpoint_errors(action: str):
+    """Turn unexpected errors in an endpoint into a 500 response"""
+    try:
+        yield
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.log(f"Failed to {action}: {e}", "red")
+        raise HTTPException(status_code=500, detail=f"Failed to {action}: {str(e)}")
 
 
 def schedule_sandbox_cleanup():
-    """Schedule automatic sandbox cleanup"""
-    global cleanup_timer, sandbox_created_at
+    """Schedule automatic cleanup of the active sandbox"""
+    global sandbox_created_at
 
-    def cleanup_sandbox():
-        global sandbox, agent, sandbox_created_at, cleanup_timer
-        if sandbox:
-            try:
-                print(
-                    f"🧹 Auto-cleanup: Shutting down sandbox after {SANDBOX_MAX_LIFETIME_MINUTES} minutes"
-                )
-                sandbox.kill()
-                sandbox = None
-                agent = None
-                sandbox_created_at = None
-                cleanup_timer = None
-            except Exception as e:
-                print(f"Error during auto-cleanup: {e}")
+    expires_at = time.monotonic() + SANDBOX_MAX_LIFETIME_MINUTES * 60
+    heapq.heappush(
+        cleanup_heap, (expires_at, next(cleanup_sequence), weakref.ref(sandbox))
+    )
+    sandbox_created_at = time.monotonic()
+
+
+async def cleanup_sandbox():
+    """Kill the active sandbox once it has reached its maximum lifetime"""
+    global sandbox, agent, sandbox_created_at
+    if sandbox:
+        try:
+            print(
+                f"🧹 Auto-cleanup: Shutting down sandbox after {SANDBOX_MAX_LIFETIME_MINUTES} minutes"
+            )
+            await asyncio.to_thread(sandbox.kill)
+            sandbox = None
+            agent = None
+            sandbox_created_at = None
+        except Exception as e:
+            print(f"Error during auto-cleanup: {e}")
+
+
+async def cleanup_loop():
+    """Periodically kill expired sandboxes and expire stale demo sessions"""
+    while True:
+        await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
+
+        now = time.monotonic()
+        while cleanup_heap and cleanup_heap[0][0] <= now:
+            _, _, sandbox_ref = heapq.heappop(cleanup_heap)
+            # Skip sandboxes that were already shut down or replaced
+            if sandbox is not None and sandbox_ref() is sandbox:
+                await cleanup_sandbox()
 
-    if cleanup_timer:
-        cleanup_timer.cancel()
+        demo_sessions.expire()
+        await expire_agent_sessions()
 
-    cleanup_timer = threading.Timer(SANDBOX_MAX_LIFETIME_MINUTES * 60, cleanup_sandbox)
-    cleanup_timer.start()
-    sandbox_created_at = datetime.now()
+
+# Actions reported by the agent that are not steps it took
+NON_STEP_ACTIONS = frozenset({"error", "timeout"})
 
 
 # Request/Response Models (keeping existing ones)
@@ -158,6 +330,55 @@ class ActionRequest(BaseModel):
     instruction: str
     screenshot: Optional[str] = None  # Base64 encoded screenshot
     single_step: bool = False  # If True, execute only one step
+    session_id: Optional[str] = None  # Run on a dedicated agent and sandbox
+    inline_screenshot: bool = True  # If False, only return screenshot_url
+
+
+async def parse_action_request(request: Request) -> ActionRequest:
+    """Validate an ActionRequest straight from the raw JSON body
+
+    pydantic-core parses and validates the body in one pass, skipping the
+    json.loads dict FastAPI would otherwise build from a multi-MB screenshot.
+    """
+    try:
+        return ActionRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        # Report error locations under "body" like FastAPI's own validation
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+        )
+
+
+# Body schema for endpoints that parse ActionRequest themselves
+ACTION_REQUEST_BODY = {
+    "requestBody": {
+        "content": {"application/json": {"schema": ActionRequest.model_json_schema()}},
+        "required": True,
+    }
+}
+
+
+class ClickRequest(BaseModel):
+    query: str
+    include_screenshot: bool = False
+
+
+class TypeRequest(BaseModel):
+    text: str
+    include_screenshot: bool = False
+
+
+class KeyRequest(BaseModel):
+    key: str
+    include_screenshot: bool = False
+
+
+class CommandRequest(BaseModel):
+    command: str
+    background: bool = False
 
 
 class ActionResponse(BaseModel):
@@ -165,6 +386,7 @@ class ActionResponse(BaseModel):
     message: str
     actions: List[Dict[str, Any]]
     screenshot: Optional[str] = None  # Base64 encoded current screenshot
+    screenshot_url: Optional[str] = None  # Raw PNG of the current screenshot
     completed: bool = False
     completion_reason: Optional[str] = None  # Why the task completed/stopped
     iterations: Optional[int] = None  # Number of steps taken
@@ -217,25 +439,245 @@ class DemoStatusResponse(BaseModel):
     timestamp: str
 
 
+@dataclass(frozen=True, slots=True)
+class DemoSession:
+    """
+    Snapshot of a demo session. Never mutated: writers store a new snapshot
+    with dataclasses.replace, so readers never see a half-updated session.
+    """
+
+    agent: Any
+    sandbox: Any
+    orchestrator: Any
+    status: str
+    created_at: datetime
+
+
+class DemoSessionStore(OrderedDict):
+    """
+    Active demo sessions, bounded in count and age. Sessions evicted for
+    either reason have their sandbox killed so abandoned runs don't leak.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.expires_at: Dict[str, float] = {}
+
+    def __setitem__(self, session_id, session):
+        # Expiry is left to expire(), called by __contains__ and the cleanup
+        # loop, so writing a session can never evict that same session
+        super().__setitem__(session_id, session)
+        # Replacing a session keeps its original expiry
+        self.expires_at.setdefault(session_id, time.monotonic() + self.ttl_seconds)
+        while len(self) > self.maxsize:
+            self.evict(next(iter(self)))
+
+    def __delitem__(self, session_id):
+        super().__delitem__(session_id)
+        self.expires_at.pop(session_id, None)
+
+    def __contains__(self, session_id):
+        self.expire()
+        return super().__contains__(session_id)
+
+    def expire(self):
+        """Evict sessions past their TTL (insertion order is expiry order)"""
+        now = time.monotonic()
+        while self:
+            oldest_id = next(iter(self))
+            if self.expires_at[oldest_id] > now:
+                break
+            self.evict(oldest_id)
+
+    def set_status(self, session_id, status: str):
+        """Atomically replace a session's snapshot with an updated status"""
+        # A session that outlived its TTL is evicted rather than updated, and
+        # updates keep the session's place and expiry
+        self.expire()
+        session = self.get(session_id)
+        if session is not None:
+            super().__setitem__(session_id, replace(session, status=status))
+
+    def evict(self, session_id):
+        """Remove a session and kill its sandbox in the threadpool"""
+        session = self.get(session_id)
+        if session is None:
+            return
+        del self[session_id]
+        asyncio.get_running_loop().run_in_executor(
+            None, self.kill_sandbox, session_id, session.sandbox
+        )
+
+    @staticmethod
+    def kill_sandbox(session_id, demo_sandbox):
+        """Kill an evicted session's sandbox (blocking)"""
+        try:
+            demo_sandbox.kill()
+            logger.log(f"Demo session {session_id} evicted", "yellow")
+        except Exception as e:
+            logger.log(f"Error killing sandbox for {session_id}: {e}", "red")
+
+
+@dataclass(slots=True)
+class AgentSession:
+    """A dedicated agent and sandbox for /act calls sharing a session_id"""
+
+    sandbox: Any
+    agent: Any
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+# Agent sessions keyed by ActionRequest.session_id, and the tasks creating
+# sessions that are still booting their sandbox
+agent_sessions: Dict[str, AgentSession] = {}
+agent_session_creations: Dict[str, asyncio.Task] = {}
+agent_sessions_lock = asyncio.Lock()
+
+# Reported to clients as the expected length of a demo run
+DEMO_ESTIMATED_DURATION = timedelta(minutes=5)
+
 # Global variables for demo sessions
-demo_sessions = {}  # Store active demo sessions
-demo_agents = {}  # Store demo agents by session ID
+demo_sessions = DemoSessionStore(
+    maxsize=256, ttl_seconds=SANDBOX_MAX_LIFETIME_MINUTES * 60
+)
 
 
 # Helper functions
-def initialize_sandbox_and_agent():
+def create_sandbox():
+    """Boot a new sandbox with its VNC stream started"""
+    new_sandbox = Sandbox()
+    # Keep the sandbox alive for as long as it may wait in the pool or serve
+    # requests; is_sandbox_expired and the cleanup loop retire it before E2B
+    # would, so a claimed sandbox never turns out to be dead
+    new_sandbox.set_timeout(
+        max(REQUEST_TIMEOUT_SECONDS, SANDBOX_MAX_LIFETIME_MINUTES * 60)
+    )
+
+    # Start VNC stream and cache the URL for viewing
+    new_sandbox.stream.start()
+    new_sandbox.get_stream_url()
+    return new_sandbox
+
+
+def is_sandbox_expired(pooled_sandbox) -> bool:
+    """Check if a sandbox has outlived SANDBOX_MAX_LIFETIME_MINUTES"""
+    age_seconds = time.monotonic() - pooled_sandbox.created_at
+    return age_seconds >= SANDBOX_MAX_LIFETIME_MINUTES * 60
+
+
+def run_in_background(coro) -> asyncio.Task:
+    """Start a task that nothing awaits, keeping it referenced until done"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_task_done)
+    return task
+
+
+def background_task_done(task: asyncio.Task):
+    """Forget a finished background task, reporting it if it failed"""
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        print(f"❌ Background task failed: {task.exception()!r}")
+
+
+async def refill_sandbox_pool():
+    """Boot sandboxes in the background until the warm pool is full"""
+    global sandbox_pool_refilling
+
+    if sandbox_pool_refilling:
+        return
+    sandbox_pool_refilling = True
+    try:
+        while sandbox_pool.qsize() < SANDBOX_POOL_SIZE:
+            try:
+                new_sandbox = await asyncio.to_thread(create_sandbox)
+            except Exception as e:
+                print(f"Error refilling sandbox pool: {e}")
+                break
+            sandbox_pool.put_nowait(new_sandbox)
+            print(f"♻️  Sandbox pool: {sandbox_pool.qsize()}/{SANDBOX_POOL_SIZE} ready")
+    finally:
+        sandbox_pool_refilling = False
+
+
+async def acquire_sandbox():
+    """Claim a warm sandbox from the pool, booting one only if the pool is empty"""
+    pooled_sandbox = None
+    while not sandbox_pool.empty():
+        candidate = sandbox_pool.get_nowait()
+        if is_sandbox_expired(candidate):
+            await asyncio.to_thread(candidate.kill)
+            continue
+        pooled_sandbox = candidate
+        break
+
+    if pooled_sandbox is None:
+        pooled_sandbox = await asyncio.to_thread(create_sandbox)
+
+    # Top the pool back up without holding up the caller
+    run_in_background(refill_sandbox_pool())
+    return pooled_sandbox
+
+
+async def run_agent(func, *args, lock: Optional[asyncio.Lock] = None):
+    """Run a blocking agent call in the threadpool without stalling the event loop"""
+    global action_epoch
+    async with lock or agent_lock:
+        try:
+            return await asyncio.to_thread(func, *args)
+        finally:
+            action_epoch += 1
+
+
+async def grab_screenshot() -> bytes:
+    """Take a screenshot, reusing the last one if nothing happened since
+
+    The caller must hold agent_lock.
+    """
+    global latest_screenshot
+    if latest_screenshot is not None:
+        epoch, taken_at, screenshot_bytes = latest_screenshot
+        age_seconds = time.monotonic() - taken_at
+        if epoch == action_epoch and age_seconds < SCREENSHOT_MAX_AGE_SECONDS:
+            return screenshot_bytes
+
+    screenshot_bytes = await asyncio.to_thread(agent.screenshot)
+    latest_screenshot = (action_epoch, time.monotonic(), screenshot_bytes)
+    return screenshot_bytes
+
+
+async def capture_screenshot() -> bytes:
+    """Get the current screenshot of the agent's sandbox"""
+    async with agent_lock:
+        return await grab_screenshot()
+
+
+def create_agent(agent_sandbox, run_name: str):
+    """Create an API agent logging to a fresh run directory"""
+    # Imported lazily: pulls in the model providers
+    from os_computer_use.api_agent import APISandboxAgent
+
+    output_dir = f"{OUTPUT_RUN_BASE}/{run_name}_{next(output_run_counter)}"
+    os.mkdir(output_dir)
+    return APISandboxAgent(agent_sandbox, output_dir, save_logs=True)
+
+
+async def initialize_sandbox_and_agent():
     """Initialize the sandbox and agent if not already done"""
-    global sandbox, agent
+    # Concurrent first requests must not each boot a sandbox
+    async with init_lock:
+        await _initialize_sandbox_and_agent()
+
+
+async def _initialize_sandbox_and_agent():
+    global sandbox, agent, action_epoch
 
     if sandbox is None:
         try:
-            sandbox = Sandbox()
-            # Set reasonable timeout
-            sandbox.set_timeout(REQUEST_TIMEOUT_SECONDS)
-
-            # Start VNC stream to get the URL for viewing
-            sandbox.stream.start()
-            vnc_url = sandbox.stream.get_url()
+            sandbox = await acquire_sandbox()
+            vnc_url = sandbox.get_stream_url()
             print(f"🖥️  Sandbox initialized successfully")
             print(f"🌐 View desktop at: {vnc_url}")
 
@@ -250,9 +692,9 @@ def initialize_sandbox_and_agent():
 
     if agent is None:
         try:
-            output_dir = f"./output/api_run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            os.makedirs(output_dir, exist_ok=True)
-            agent = APISandboxAgent(sandbox, output_dir, save_logs=True)
+            agent = create_agent(sandbox, "api_run")
+            # Never serve a screenshot of a previous sandbox
+            action_epoch += 1
             print("✅ Agent initialized successfully")
         except Exception as e:
             print(f"❌ Error initializing agent: {e}")
@@ -261,25 +703,142 @@ def initialize_sandbox_and_agent():
             )
 
 
+async def get_agent_session(session_id: str) -> AgentSession:
+    """Get the agent session for session_id, creating it on first use"""
+    async with agent_sessions_lock:
+        session = agent_sessions.get(session_id)
+        if session is not None:
+            return session
+
+        creation = agent_session_creations.get(session_id)
+        if creation is None:
+            if len(agent_sessions) + len(agent_session_creations) >= MAX_AGENT_SESSIONS:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=f"Too many agent sessions. Max {MAX_AGENT_SESSIONS}.",
+                )
+            creation = asyncio.create_task(create_agent_session(session_id))
+            agent_session_creations[session_id] = creation
+
+    # The sandbox may need a cold boot, so wait outside the lock; concurrent
+    # requests for the same session share the creation task
+    return await asyncio.shield(creation)
+
+
+async def create_agent_session(session_id: str) -> AgentSession:
+    """Claim a sandbox and agent for a new session, then register it"""
+    session = None
+    try:
+        session_sandbox = await acquire_sandbox()
+        try:
+            session_agent = create_agent(session_sandbox, "session_run")
+        except Exception:
+            await asyncio.to_thread(session_sandbox.kill)
+            raise
+        session = AgentSession(sandbox=session_sandbox, agent=session_agent)
+        print(f"🧵 Agent session {session_id} created")
+        return session
+    finally:
+        async with agent_sessions_lock:
+            del agent_session_creations[session_id]
+            if session is not None:
+                agent_sessions[session_id] = session
+
+
+async def resolve_agent(session_id: Optional[str]) -> Tuple[Any, asyncio.Lock]:
+    """Get the agent for a request and the lock serializing its calls"""
+    if session_id is None:
+        await initialize_sandbox_and_agent()
+        return agent, agent_lock
+
+    session = await get_agent_session(session_id)
+    return session.agent, session.lock
+
+
+async def close_agent_session(session_id: str) -> bool:
+    """Remove an agent session and kill its sandbox"""
+    session = agent_sessions.pop(session_id, None)
+    if session is None:
+        return False
+
+    # Let a running action finish before the sandbox goes away. Used
+    # sandboxes are never pooled again: they hold the session's desktop state
+    async with session.lock:
+        await asyncio.to_thread(session.sandbox.kill)
+    return True
+
+
+async def expire_agent_sessions():
+    """Close agent sessions whose sandbox has reached its maximum lifetime"""
+    for session_id, session in list(agent_sessions.items()):
+        if is_sandbox_expired(session.sandbox) and not session.lock.locked():
+            print(f"🧹 Auto-cleanup: Closing agent session {session_id}")
+            try:
+                await close_agent_session(session_id)
+            except Exception as e:
+                print(f"Error closing agent session {session_id}: {e}")
+
+
 def screenshot_to_base64(screenshot_bytes: bytes) -> str:
     """Convert screenshot bytes to base64 string"""
-    return base64.b64encode(screenshot_bytes).decode("utf-8")
+    return b64encode_as_string(screenshot_bytes)
+
+
+# 96 KiB of input encodes to 128 KiB of output and is a multiple of the
+# 3-byte base64 group, so the encoded chunks concatenate without padding
+BASE64_CHUNK_SIZE = 98304
+
+
+def iter_base64_chunks(data: bytes):
+    """Yield the base64 encoding of data in independently encoded chunks"""
+    view = memoryview(data)
+    for start in range(0, len(view), BASE64_CHUNK_SIZE):
+        yield base64.b64encode(view[start : start + BASE64_CHUNK_SIZE])
 
 
 def base64_to_bytes(base64_string: str) -> bytes:
     """Convert base64 string to bytes"""
-    return base64.b64decode(base64_string)
+    return base64.b64decode(base64_string, validate=False)
+
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(epoch_seconds: int) -> str:
+    """Format a whole-second epoch time as an ISO string"""
+    return datetime.fromtimestamp(epoch_seconds).isoformat()
+
+
+def current_timestamp() -> str:
+    """Get the current ISO timestamp for responses, formatted once per second"""
+    return _iso_timestamp(int(time.time()))
+
+
+def cache_screenshot(screenshot_bytes: bytes) -> str:
+    """Store screenshot bytes in the LRU cache and return its URL"""
+    screenshot_id = uuid.uuid4().hex
+    screenshot_cache[screenshot_id] = screenshot_bytes
+    while len(screenshot_cache) > SCREENSHOT_CACHE_SIZE:
+        screenshot_cache.popitem(last=False)
+    return f"/screenshot/{screenshot_id}.png"
 
 
 # API Endpoints
 @app.on_event("startup")
 async def startup_event():
-    """Initialize sandbox and agent on startup"""
-    try:
-        initialize_sandbox_and_agent()
-        print("API server started successfully")
-    except Exception as e:
-        print(f"Failed to start API server: {e}")
+    """Start background tasks; the sandbox and agent are created lazily"""
+    global cleanup_task
+
+    # Size both the asyncio and anyio threadpools for long blocking agent calls
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=THREADPOOL_SIZE)
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+    print(f"🔤 Base64 codec: {BASE64_BACKEND}")
+    cleanup_task = asyncio.create_task(cleanup_loop())
+
+    # Warm the pool in the background so the first request finds a sandbox
+    run_in_background(refill_sandbox_pool())
+    print("API server started successfully")
 
 
 @app.on_event("shutdown")
@@ -288,106 +847,154 @@ async def shutdown_event():
     global sandbox
     if sandbox:
         try:
-            sandbox.kill()
+            await asyncio.to_thread(sandbox.kill)
             print("Sandbox stopped")
         except Exception as e:
             print(f"Error stopping sandbox: {e}")
 
+    # Kill the pooled and session sandboxes concurrently
+    pooled_sandboxes = [session.sandbox for session in agent_sessions.values()]
+    agent_sessions.clear()
+    while not sandbox_pool.empty():
+        pooled_sandboxes.append(sandbox_pool.get_nowait())
+    results = await asyncio.gather(
+        *(asyncio.to_thread(s.kill) for s in pooled_sandboxes),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Error stopping pooled sandbox: {result}")
 
-@app.get("/status", response_model=StatusResponse)
-async def get_status(request: Request, _: bool = Depends(verify_api_key)):
-    """Get the current status of the agent and sandbox"""
-    try:
-        # Get client IP for rate limiting
-        client_ip = request.client.host if request.client else "unknown"
+    if redis_client is not None:
+        await redis_client.aclose()
 
-        # Apply rate limiting
-        rate_limit_check(client_ip)
+    # Write out log lines the background writer hasn't flushed yet
+    agent_logger.flush()
 
+
+@app.get("/healthz")
+async def healthz():
+    """Liveness probe: the process is up and serving requests"""
+    return {"ok": True}
+
+
+@app.get("/readyz")
+async def readyz():
+    """Readiness probe: a sandbox is active or waiting in the warm pool"""
+    ready = sandbox is not None or not sandbox_pool.empty() or SANDBOX_POOL_SIZE == 0
+    if not ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="No sandbox ready yet",
+        )
+    return {"ok": True}
+
+
+@app.get("/status", response_model=StatusResponse)
+async def get_status(
+    request: Request,
+    _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
+):
+    """Get the current status of the agent and sandbox"""
+    with endpoint_errors("get status"):
         uptime = None
         if sandbox_created_at:
-            uptime = (
-                datetime.now() - sandbox_created_at
-            ).total_seconds() / 60  # in minutes
-
-        rate_limit_remaining = None
-        with rate_limit_lock:
-            if client_ip in rate_limit_storage:
-                # Clean old entries
-                rate_limit_storage[client_ip] = [
-                    timestamp
-                    for timestamp in rate_limit_storage[client_ip]
-                    if time.time() - timestamp < 60
-                ]
-                rate_limit_remaining = RATE_LIMIT_PER_MINUTE - len(
-                    rate_limit_storage[client_ip]
-                )
+            uptime = (time.monotonic() - sandbox_created_at) / 60  # in minutes
 
         return StatusResponse(
             status="running",
             sandbox_active=sandbox is not None,
             agent_initialized=agent is not None,
             sandbox_uptime_minutes=uptime,
-            rate_limit_remaining=rate_limit_remaining,
+            rate_limit_remaining=getattr(request.state, "rate_limit_remaining", None),
         )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get status: {str(e)}")
 
 
 @app.get("/screenshot", response_model=ScreenshotResponse)
-async def get_screenshot(request: Request, _: bool = Depends(verify_api_key)):
+async def get_screenshot(
+    _: bool = Depends(verify_api_key), client_ip: str = Depends(rate_limit_dep)
+):
     """Get current screenshot from the sandbox"""
-    try:
-        # Apply rate limiting
-        client_ip = request.client.host if request.client else "unknown"
-        rate_limit_check(client_ip)
-
-        initialize_sandbox_and_agent()
-        screenshot_bytes = agent.screenshot()
+    with endpoint_errors("get screenshot"):
+        await initialize_sandbox_and_agent()
+        screenshot_bytes = await capture_screenshot()
         screenshot_b64 = screenshot_to_base64(screenshot_bytes)
 
         return ScreenshotResponse(
-            screenshot=screenshot_b64, timestamp=datetime.now().isoformat()
+            screenshot=screenshot_b64, timestamp=current_timestamp()
         )
-    except Exception as e:
+
+
+@app.get("/screenshot.png")
+async def get_screenshot_png(
+    encode: Optional[str] = None,
+    _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
+):
+    """Get current screenshot from the sandbox as raw PNG bytes
+
+    Pass ?encode=base64 for a plain-text base64 body instead.
+    """
+    with endpoint_errors("get screenshot"):
+        await initialize_sandbox_and_agent()
+        screenshot_bytes = await capture_screenshot()
+
+        if encode == "base64":
+            # Encode chunk by chunk so sending starts before encoding finishes
+            return StreamingResponse(
+                iter_base64_chunks(screenshot_bytes), media_type="text/plain"
+            )
+        if encode is not None:
+            raise HTTPException(
+                status_code=400, detail=f"Unsupported encoding: {encode}"
+            )
+
+        return Response(content=screenshot_bytes, media_type="image/png")
+
+
+@app.get("/screenshot/{screenshot_id}.png")
+async def get_cached_screenshot(
+    screenshot_id: str,
+    _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
+):
+    """Get a recent screenshot returned by /act as raw PNG bytes"""
+    screenshot_bytes = screenshot_cache.get(screenshot_id)
+    if screenshot_bytes is None:
         raise HTTPException(
-            status_code=500, detail=f"Failed to get screenshot: {str(e)}"
+            status_code=404, detail=f"Screenshot {screenshot_id} not found"
         )
 
+    return Response(content=screenshot_bytes, media_type="image/png")
+
 
 @app.get("/stream", response_model=StreamResponse)
-async def get_stream_url(request: Request, _: bool = Depends(verify_api_key)):
+async def get_stream_url(
+    _: bool = Depends(verify_api_key), client_ip: str = Depends(rate_limit_dep)
+):
     """Get the VNC stream URL for viewing the desktop"""
-    try:
-        # Apply rate limiting
-        client_ip = request.client.host if request.client else "unknown"
-        rate_limit_check(client_ip)
-
-        initialize_sandbox_and_agent()
+    with endpoint_errors("get stream URL"):
+        await initialize_sandbox_and_agent()
 
         # Get the VNC stream URL
-        vnc_url = sandbox.stream.get_url()
+        vnc_url = sandbox.get_stream_url()
 
         print(f"🌐 Stream URL requested: {vnc_url}")
 
-        return StreamResponse(stream_url=vnc_url, timestamp=datetime.now().isoformat())
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to get stream URL: {str(e)}"
-        )
+        return StreamResponse(stream_url=vnc_url, timestamp=current_timestamp())
 
 
-@app.post("/act", response_model=ActionResponse)
+@app.post("/act", response_model=ActionResponse, openapi_extra=ACTION_REQUEST_BODY)
 async def execute_action(
-    action_request: ActionRequest, request: Request, _: bool = Depends(verify_api_key)
+    # Declared first so auth and rate limiting run before the body is parsed
+    _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
+    action_request: ActionRequest = Depends(parse_action_request),
 ):
     """Execute an action based on instruction"""
-    try:
-        # Apply rate limiting
-        client_ip = request.client.host if request.client else "unknown"
-        rate_limit_check(client_ip)
-
-        initialize_sandbox_and_agent()
+    with endpoint_errors("execute action"):
+        target_agent, lock = await resolve_agent(action_request.session_id)
 
         print(f"🚀 Executing action: '{action_request.instruction}'")
         print(f"📋 Single step mode: {action_request.single_step}")
@@ -399,7 +1006,9 @@ async def execute_action(
 
         if action_request.single_step:
             # Execute only one step
-            result = agent.execute_single_step(action_request.instruction)
+            result = await run_agent(
+                target_agent.execute_single_step, action_request.instruction, lock=lock
+            )
             actions_taken.append(result)
             completed = result.get("completed", False)
             completion_reason = (
@@ -409,69 +1018,155 @@ async def execute_action(
             print(f"✅ Single step completed: {result.get('action', 'unknown')}")
         else:
             # Execute the full instruction (may take multiple steps)
-            actions_taken, completed = agent.run_with_tracking(
-                action_request.instruction
+            actions_taken, completed, completion_reason = await run_agent(
+                target_agent.run_with_tracking, action_request.instruction, lock=lock
             )
-            iterations = len(
-                [
-                    a
-                    for a in actions_taken
-                    if a.get("action") not in ["error", "timeout"]
-                ]
+            iterations = sum(
+                1 for a in actions_taken if a.get("action") not in NON_STEP_ACTIONS
             )
 
-            # Determine completion reason
-            if completed:
-                completion_reason = "stop_tool_called"
-            elif any(a.get("action") == "timeout" for a in actions_taken):
-                completion_reason = "max_iterations_reached"
-            elif any(a.get("action") == "error" for a in actions_taken):
-                completion_reason = "error_occurred"
-            else:
-                completion_reason = "unknown"
-
             print(f"✅ Full instruction completed with {len(actions_taken)} actions")
 
         # Get current screenshot
-        screenshot_bytes = agent.screenshot()
-        screenshot_b64 = screenshot_to_base64(screenshot_bytes)
+        if action_request.session_id is None:
+            screenshot_bytes = await capture_screenshot()
+        else:
+            screenshot_bytes = await run_agent(target_agent.screenshot, lock=lock)
+        screenshot_url = cache_screenshot(screenshot_bytes)
+        screenshot_b64 = (
+            screenshot_to_base64(screenshot_bytes)
+            if action_request.inline_screenshot
+            else None
+        )
 
         print(f"📸 Screenshot captured and returned")
         print(f"🏁 Task completed: {completed} ({completion_reason})")
 
-        return ActionResponse(
-            success=True,
-            message="Action executed successfully",
-            actions=actions_taken,
-            screenshot=screenshot_b64,
-            completed=completed,
-            completion_reason=completion_reason,
-            iterations=iterations,
+        # Returned as a response directly (response_model still documents
+        # it) so the multi-MB screenshot string isn't re-validated
+        return DefaultJSONResponse(
+            {
+                "success": True,
+                "message": "Action executed successfully",
+                "actions": actions_taken,
+                "screenshot": screenshot_b64,
+                "screenshot_url": screenshot_url,
+                "completed": completed,
+                "completion_reason": completion_reason,
+                "iterations": iterations,
+            }
         )
 
-    except Exception as e:
-        print(f"❌ Action failed: {str(e)}")
-        raise HTTPException(
-            status_code=500, detail=f"Failed to execute action: {str(e)}"
+
+@app.post("/act/stream", openapi_extra=ACTION_REQUEST_BODY)
+async def execute_action_stream(
+    request: Request,
+    # Declared first so auth and rate limiting run before the body is parsed
+    _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
+    action_request: ActionRequest = Depends(parse_action_request),
+):
+    """Execute an instruction, streaming each action as it is taken
+
+    Events are NDJSON, or Server-Sent Events when the client sends
+    Accept: text/event-stream.
+    """
+    with endpoint_errors("execute action"):
+        target_agent, lock = await resolve_agent(action_request.session_id)
+
+    print(f"🚀 Streaming action: '{action_request.instruction}'")
+
+    async def generate_events():
+        global action_epoch
+        iterations = 0
+
+        error = None
+
+        # Hold the agent for the whole run; each step runs in the threadpool
+        async with lock:
+            actions = target_agent.iter_with_tracking(action_request.instruction)
+            step = None
+            try:
+                while True:
+                    # Shielded, so a client disconnect leaves the step running
+                    # under the lock instead of orphaning it in its thread
+                    step = asyncio.ensure_future(asyncio.to_thread(next, actions, None))
+                    action = await asyncio.shield(step)
+                    if action is None:
+                        break
+
+                    if action.get("action") not in NON_STEP_ACTIONS:
+                        iterations += 1
+                    yield ndjson_line({"type": "action", "action": action})
+            except Exception as e:
+                # The headers are already sent, so report the error in-stream
+                print(f"❌ Streaming action failed: {str(e)}")
+                error = str(e)
+            finally:
+                # Actions may have run even if the run stopped part way
+                action_epoch += 1
+                # If the client went away, finish the in-flight step and stop
+                # the run before the lock lets another request use the agent
+                with anyio.CancelScope(shield=True):
+                    if step is not None and not step.done():
+                        await asyncio.wait([step])
+                    await asyncio.to_thread(actions.close)
+
+            completed = error is None and target_agent.task_completed
+            completion_reason = (
+                "error_occurred" if error else target_agent.completion_reason
+            )
+
+            try:
+                if action_request.session_id is None:
+                    screenshot_bytes = await grab_screenshot()
+                else:
+                    screenshot_bytes = await asyncio.to_thread(target_agent.screenshot)
+                screenshot_url = cache_screenshot(screenshot_bytes)
+            except Exception as e:
+                print(f"❌ Failed to capture final screenshot: {str(e)}")
+                screenshot_url = None
+
+        print(f"🏁 Task completed: {completed} ({completion_reason})")
+
+        if error is not None:
+            yield ndjson_line({"type": "error", "error": error})
+        yield ndjson_line(
+            {
+                "type": "result",
+                "success": error is None,
+                "completed": completed,
+                "completion_reason": completion_reason,
+                "iterations": iterations,
+                "screenshot_url": screenshot_url,
+            }
+        )
+
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return StreamingResponse(
+            (b"data: " + line + b"\n" async for line in generate_events()),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
         )
+    return StreamingResponse(generate_events(), media_type="application/x-ndjson")
 
 
 @app.post("/click")
 async def click_element(
-    query: str = Form(...), request: Request = None, _: bool = Depends(verify_api_key)
+    click_request: ClickRequest,
+    _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
 ):
     """Click on a specific element"""
-    try:
-        # Apply rate limiting
-        if request:
-            client_ip = request.client.host if request.client else "unknown"
-            rate_limit_check(client_ip)
+    with endpoint_errors("click element"):
+        await initialize_sandbox_and_agent()
+        query = click_request.query
+        result = await run_agent(agent.click, query)
 
-        initialize_sandbox_and_agent()
-        result = agent.click(query)
-
-        screenshot_bytes = agent.screenshot()
-        screenshot_b64 = screenshot_to_base64(screenshot_bytes)
+        # Only capture and encode a screenshot when the caller asks for one
+        screenshot_b64 = None
+        if click_request.include_screenshot:
+            screenshot_b64 = screenshot_to_base64(await capture_screenshot())
 
         return {
             "success": True,
@@ -480,28 +1175,24 @@ async def click_element(
             "action": "click",
             "query": query,
         }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to click element: {str(e)}"
-        )
 
 
 @app.post("/type")
 async def type_text(
-    text: str = Form(...), request: Request = None, _: bool = Depends(verify_api_key)
+    type_request: TypeRequest,
+    _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
 ):
     """Type text into the current focus"""
-    try:
-        # Apply rate limiting
-        if request:
-            client_ip = request.client.host if request.client else "unknown"
-            rate_limit_check(client_ip)
+    with endpoint_errors("type text"):
+        await initialize_sandbox_and_agent()
+        text = type_request.text
+        result = await run_agent(agent.type_text, text)
 
-        initialize_sandbox_and_agent()
-        result = agent.type_text(text)
-
-        screenshot_bytes = agent.screenshot()
-        screenshot_b64 = screenshot_to_base64(screenshot_bytes)
+        # Only capture and encode a screenshot when the caller asks for one
+        screenshot_b64 = None
+        if type_request.include_screenshot:
+            screenshot_b64 = screenshot_to_base64(await capture_screenshot())
 
         return {
             "success": True,
@@ -510,26 +1201,24 @@ async def type_text(
             "action": "type",
             "text": text,
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to type text: {str(e)}")
 
 
 @app.post("/key")
 async def send_key(
-    key: str = Form(...), request: Request = None, _: bool = Depends(verify_api_key)
+    key_request: KeyRequest,
+    _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
 ):
     """Send a key combination"""
-    try:
-        # Apply rate limiting
-        if request:
-            client_ip = request.client.host if request.client else "unknown"
-            rate_limit_check(client_ip)
-
-        initialize_sandbox_and_agent()
-        result = agent.send_key(key)
+    with endpoint_errors("send key"):
+        await initialize_sandbox_and_agent()
+        key = key_request.key
+        result = await run_agent(agent.send_key, key)
 
-        screenshot_bytes = agent.screenshot()
-        screenshot_b64 = screenshot_to_base64(screenshot_bytes)
+        # Only capture and encode a screenshot when the caller asks for one
+        screenshot_b64 = None
+        if key_request.include_screenshot:
+            screenshot_b64 = screenshot_to_base64(await capture_screenshot())
 
         return {
             "success": True,
@@ -538,30 +1227,24 @@ async def send_key(
             "action": "key",
             "key": key,
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to send key: {str(e)}")
 
 
 @app.post("/command")
 async def run_command(
-    command: str = Form(...),
-    background: bool = Form(False),
-    request: Request = None,
+    command_request: CommandRequest,
     _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
 ):
     """Run a shell command"""
-    try:
-        # Apply rate limiting
-        if request:
-            client_ip = request.client.host if request.client else "unknown"
-            rate_limit_check(client_ip)
-
-        initialize_sandbox_and_agent()
+    with endpoint_errors("run command"):
+        await initialize_sandbox_and_agent()
+        command = command_request.command
+        background = command_request.background
 
         if background:
-            result = agent.run_background_command(command)
+            result = await run_agent(agent.run_background_command, command)
         else:
-            result = agent.run_command(command)
+            result = await run_agent(agent.run_command, command)
 
         return {
             "success": True,
@@ -570,85 +1253,81 @@ async def run_command(
             "command": command,
             "background": background,
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to run command: {str(e)}")
 
 
 @app.post("/reset")
-async def reset_agent(request: Request = None, _: bool = Depends(verify_api_key)):
+async def reset_agent(
+    _: bool = Depends(verify_api_key), client_ip: str = Depends(rate_limit_dep)
+):
     """Reset the agent's conversation memory"""
-    try:
-        # Apply rate limiting
-        if request:
-            client_ip = request.client.host if request.client else "unknown"
-            rate_limit_check(client_ip)
-
-        initialize_sandbox_and_agent()
-        agent.messages = []
+    with endpoint_errors("reset agent"):
+        await initialize_sandbox_and_agent()
+        # Wait for any running action, which iterates over the messages
+        async with agent_lock:
+            agent.reset_memory()
 
         return {"success": True, "message": "Agent memory reset successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to reset agent: {str(e)}")
 
 
 @app.post("/shutdown")
-async def shutdown_sandbox(request: Request = None, _: bool = Depends(verify_api_key)):
+async def shutdown_sandbox(
+    _: bool = Depends(verify_api_key), client_ip: str = Depends(rate_limit_dep)
+):
     """Shutdown and kill the sandbox"""
-    global sandbox, agent, cleanup_timer
-
-    try:
-        # Apply rate limiting
-        if request:
-            client_ip = request.client.host if request.client else "unknown"
-            rate_limit_check(client_ip)
+    global sandbox, agent
 
+    with endpoint_errors("shutdown sandbox"):
         if sandbox:
             print("🧹 Manual shutdown: Shutting down sandbox...")
-            sandbox.kill()
+            # Never pooled again: it holds the previous caller's desktop state
+            await asyncio.to_thread(sandbox.kill)
             print("✅ Sandbox stopped successfully")
 
-            # Cancel cleanup timer and reset global variables
-            if cleanup_timer:
-                cleanup_timer.cancel()
-                cleanup_timer = None
-
+            # Reset global variables (the pending cleanup entry is skipped)
             sandbox = None
             agent = None
 
             return {"success": True, "message": "Sandbox shutdown successfully"}
         else:
             return {"success": True, "message": "No active sandbox to shutdown"}
-    except Exception as e:
-        print(f"❌ Error during shutdown: {str(e)}")
-        raise HTTPException(
-            status_code=500, detail=f"Failed to shutdown sandbox: {str(e)}"
-        )
+
+
+@app.post("/session/{session_id}/shutdown")
+async def shutdown_agent_session(
+    session_id: str,
+    _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
+):
+    """Close an agent session, returning its sandbox to the warm pool"""
+    with endpoint_errors("shutdown agent session"):
+        if not await close_agent_session(session_id):
+            raise HTTPException(
+                status_code=404, detail=f"Agent session {session_id} not found"
+            )
+
+        return {"success": True, "message": f"Agent session {session_id} closed"}
 
 
 # Demo Session Endpoints
 @app.post("/demo-session", response_model=DemoSessionResponse)
 async def create_demo_session(
     demo_request: DemoSessionRequest,
-    request: Request,
     _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
 ):
     """Create a new demo session with GitHub repository and Google Meet integration"""
-    try:
-        # Apply rate limiting
-        client_ip = request.client.host if request.client else "unknown"
-        rate_limit_check(client_ip)
-
-        # Initialize sandbox and create demo agent
-        demo_sandbox = Sandbox()
-        demo_sandbox.set_timeout(REQUEST_TIMEOUT_SECONDS)
+    # Imported lazily so workers that never run demos skip loading them
+    from os_computer_use.demo_agent import DemoAgent
+    from os_computer_use.demo_orchestrator import DemoOrchestrator
 
-        # Start VNC stream
-        demo_sandbox.stream.start()
-        sandbox_url = demo_sandbox.stream.get_url()
+    with endpoint_errors("create demo session"):
+        # Claim a warm sandbox and create demo agent
+        demo_sandbox = await acquire_sandbox()
+        sandbox_url = demo_sandbox.get_stream_url()
 
         # Create demo agent
-        output_dir = f"./output/demo_run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        os.makedirs(output_dir, exist_ok=True)
+        output_dir = f"{OUTPUT_RUN_BASE}/demo_run_{next(output_run_counter)}"
+        os.mkdir(output_dir)
         demo_agent = DemoAgent(demo_sandbox, output_dir, save_logs=True)
 
         # Initialize demo session
@@ -657,30 +1336,33 @@ async def create_demo_session(
         )
 
         # Store session for tracking
-        demo_sessions[session_id] = {
-            "agent": demo_agent,
-            "sandbox": demo_sandbox,
-            "orchestrator": DemoOrchestrator(demo_agent),
-            "status": "initialized",
-            "created_at": datetime.now(),
-        }
+        orchestrator = DemoOrchestrator(demo_agent)
+        created_at = datetime.now()
+        demo_sessions[session_id] = DemoSession(
+            agent=demo_agent,
+            sandbox=demo_sandbox,
+            orchestrator=orchestrator,
+            status="initialized",
+            created_at=created_at,
+        )
 
         # Start demo execution in background
-        import asyncio
-
         async def run_demo_background():
             try:
-                orchestrator = demo_sessions[session_id]["orchestrator"]
                 await orchestrator.run_full_demo(
                     demo_request.githubUrl, demo_request.meetLink
                 )
-                demo_sessions[session_id]["status"] = "completed"
+                # Keep completed sessions: the live demo runs in the sandbox
+                # until cleanup or the session TTL
+                demo_sessions.set_status(session_id, "completed")
             except Exception as e:
                 logger.log(f"Demo execution error: {e}", "red")
-                demo_sessions[session_id]["status"] = "failed"
+                demo_sessions.set_status(session_id, "failed")
+                # Free the sandbox of a failed run right away
+                demo_sessions.evict(session_id)
 
         # Execute in background
-        asyncio.create_task(run_demo_background())
+        run_in_background(run_demo_background())
 
         # Return immediate response
         return DemoSessionResponse(
@@ -690,39 +1372,31 @@ async def create_demo_session(
             currentStep="open_terminal",
             stepProgress="0/8",
             logs=[],
-            estimatedCompletion=(datetime.now() + timedelta(minutes=5)).isoformat(),
-            timestamp=datetime.now().isoformat(),
-        )
-
-    except Exception as e:
-        logger.log(f"Error creating demo session: {e}", "red")
-        raise HTTPException(
-            status_code=500, detail=f"Failed to create demo session: {str(e)}"
+            estimatedCompletion=(created_at + DEMO_ESTIMATED_DURATION).isoformat(),
+            timestamp=current_timestamp(),
         )
 
 
 @app.get("/demo-session/{session_id}/status", response_model=DemoStatusResponse)
 async def get_demo_status(
-    session_id: str, request: Request, _: bool = Depends(verify_api_key)
+    session_id: str,
+    _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
 ):
     """Get the current status of a demo session"""
-    try:
-        # Apply rate limiting
-        client_ip = request.client.host if request.client else "unknown"
-        rate_limit_check(client_ip)
-
+    with endpoint_errors("get demo status"):
         # Check if session exists
         if session_id not in demo_sessions:
             raise HTTPException(
                 status_code=404, detail=f"Demo session {session_id} not found"
             )
 
-        session_data = demo_sessions[session_id]
-        demo_agent = session_data["agent"]
-        orchestrator = session_data["orchestrator"]
+        session = demo_sessions[session_id]
+        demo_agent = session.agent
+        orchestrator = session.orchestrator
 
         # Get progress status from agent
-        progress = demo_agent.get_progress_status()
+        progress = await asyncio.to_thread(demo_agent.get_progress_status)
 
         return DemoStatusResponse(
             sessionId=session_id,
@@ -730,44 +1404,34 @@ async def get_demo_status(
             completedSteps=progress["completed_steps"],
             currentStep=progress["current_step"],
             stepProgress=progress["step_progress"],
-            logs=orchestrator.execution_log,
+            logs=orchestrator.get_execution_log(),
             sandboxUrl=progress["sandbox_url"],
             runtimeMinutes=progress["runtime_minutes"],
-            timestamp=datetime.now().isoformat(),
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.log(f"Error getting demo status: {e}", "red")
-        raise HTTPException(
-            status_code=500, detail=f"Failed to get demo status: {str(e)}"
+            timestamp=current_timestamp(),
         )
 
 
 @app.post("/demo-session/{session_id}/cleanup")
 async def cleanup_demo_session(
-    session_id: str, request: Request, _: bool = Depends(verify_api_key)
+    session_id: str,
+    _: bool = Depends(verify_api_key),
+    client_ip: str = Depends(rate_limit_dep),
 ):
     """Clean up and terminate a demo session"""
-    try:
-        # Apply rate limiting
-        client_ip = request.client.host if request.client else "unknown"
-        rate_limit_check(client_ip)
-
+    with endpoint_errors("cleanup demo session"):
         # Check if session exists
         if session_id not in demo_sessions:
             raise HTTPException(
                 status_code=404, detail=f"Demo session {session_id} not found"
             )
 
-        session_data = demo_sessions[session_id]
-        demo_agent = session_data["agent"]
-        demo_sandbox = session_data["sandbox"]
+        session = demo_sessions[session_id]
+        demo_agent = session.agent
+        demo_sandbox = session.sandbox
 
         # Clean up resources
         demo_agent.cleanup_demo_session()
-        demo_sandbox.kill()
+        await asyncio.to_thread(demo_sandbox.kill)
 
         # Remove from active sessions
         del demo_sessions[session_id]
@@ -777,23 +1441,30 @@ async def cleanup_demo_session(
         return {
             "success": True,
             "message": f"Demo session {session_id} cleaned up successfully",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": current_timestamp(),
         }
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.log(f"Error cleaning up demo session: {e}", "red")
-        raise HTTPException(
-            status_code=500, detail=f"Failed to cleanup demo session: {str(e)}"
-        )
-
 
 def main():
     """Start the FastAPI server"""
     port = int(os.getenv("PORT", 8000))  # Railway provides PORT env var
+    # Use the C-accelerated event loop and HTTP parser when they are installed
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    # Cap in-flight requests so slow sandbox work can't queue up unbounded
+    limit_concurrency = os.getenv("LIMIT_CONCURRENCY")
     uvicorn.run(
-        "api_server:app", host="0.0.0.0", port=port, reload=False, log_level="info"
+        "api_server:app",
+        host="0.0.0.0",
+        port=port,
+        reload=False,
+        loop=loop,
+        http=http,
+        # Each worker holds its own sandbox, sessions and (without REDIS_URL)
+        # rate limits, so only raise this behind sticky routing
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        limit_concurrency=int(limit_concurrency) if limit_concurrency else None,
+        log_level=os.getenv("LOG_LEVEL", "warning").lower(),
     )
 
 
@@ -1,10 +1,36 @@
-from os_computer_use.sandbox_agent import SandboxAgent as BaseSandboxAgent
+from os_computer_use.sandbox_agent import SandboxAgent as BaseSandboxAgent, tools
 from os_computer_use.config import vision_model, action_model, grounding_model
 from os_computer_use.llm_provider import Message
 from os_computer_use.logging import logger
 import json
+from collections import deque
 from datetime import datetime
 
+try:
+    # orjson serializes the per-step tool calls faster and without whitespace
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+except ImportError:
+    dumps = json.dumps
+
+# Conversation messages kept in agent memory; older ones are dropped
+MAX_MESSAGES = 256
+
+# Fixed prompts sent on every step, built once. Providers copy messages
+# rather than mutate them, except Mistral, which only edits user messages.
+SYSTEM_MESSAGE = Message(
+    "You are an AI assistant with computer use abilities.", role="system"
+)
+SINGLE_STEP_PROMPT = Message(
+    "I will now use tool calls to take the next single action, or use the stop command if the objective is complete.",
+)
+MULTI_STEP_PROMPT = Message(
+    "I will now use tool calls to take these actions, or use the stop command if the objective is complete.",
+)
+
 
 class APISandboxAgent(BaseSandboxAgent):
     """
@@ -13,7 +39,42 @@ class APISandboxAgent(BaseSandboxAgent):
 
     def __init__(self, sandbox, output_dir=".", save_logs=True):
         super().__init__(sandbox, output_dir, save_logs)
+        # Bounded, and cleared in place on reset rather than reallocated
+        self.messages = deque(maxlen=MAX_MESSAGES)
         self.tracked_actions = []
+        self.task_completed = False
+        self.completion_reason = None
+        self.last_instruction = None  # Objective most recently added to messages
+        self.objective_message = None  # Its message, pinned once trimmed off
+
+    def reset_memory(self):
+        """Forget the conversation so far, including the current objective"""
+        self.messages.clear()
+        self.last_instruction = None
+        self.objective_message = None
+
+    def history(self):
+        """
+        Message history for the vision and action model prompts. The history
+        drops its oldest messages first, which in long runs includes the
+        objective, so it is pinned ahead of the history once trimmed off
+        """
+        objective = self.objective_message
+        if (
+            objective is not None
+            and len(self.messages) == self.messages.maxlen
+            and not any(message is objective for message in self.messages)
+        ):
+            return [objective, *self.messages]
+        return self.messages
+
+    def build_prompt(self, screen_thought, step_prompt):
+        """Assemble the action model prompt around the message history"""
+        prompt = [SYSTEM_MESSAGE]
+        prompt.extend(self.history())
+        prompt.append(Message(screen_thought))
+        prompt.append(step_prompt)
+        return prompt
 
     def execute_single_step(self, instruction):
         """
@@ -22,31 +83,22 @@ class APISandboxAgent(BaseSandboxAgent):
         """
         try:
             # Add the instruction to messages if it's new
-            if (
-                not self.messages
-                or self.messages[-1].get("content") != f"OBJECTIVE: {instruction}"
-            ):
-                self.messages.append(Message(f"OBJECTIVE: {instruction}"))
+            if instruction != self.last_instruction:
+                self.objective_message = Message(f"OBJECTIVE: {instruction}")
+                self.messages.append(self.objective_message)
                 logger.log(f"USER: {instruction}", print=False)
+                self.last_instruction = instruction
 
-            # Stop the sandbox from timing out - increase to 30 minutes
-            self.sandbox.set_timeout(1800)
+            # Stop the sandbox from timing out
+            self.keep_sandbox_alive()
+
+            # Describe the screen before assembling the prompt around it
+            screen_thought = f"THOUGHT: {self.append_screenshot()}"
+            logger.log(screen_thought, "green")
 
             # Get the current thought and action
             content, tool_calls = action_model.call(
-                [
-                    Message(
-                        "You are an AI assistant with computer use abilities.",
-                        role="system",
-                    ),
-                    *self.messages,
-                    Message(
-                        logger.log(f"THOUGHT: {self.append_screenshot()}", "green")
-                    ),
-                    Message(
-                        "I will now use tool calls to take the next single action, or use the stop command if the objective is complete.",
-                    ),
-                ],
+                self.build_prompt(screen_thought, SINGLE_STEP_PROMPT),
                 self.get_tools(),
             )
 
@@ -63,8 +115,8 @@ class APISandboxAgent(BaseSandboxAgent):
 
                 if not completed:
                     # Execute the action
-                    logger.log(f"ACTION: {name} {str(parameters)}", "red")
-                    self.messages.append(Message(json.dumps(tool_call)))
+                    logger.log(f"ACTION: {name} {parameters}", "red")
+                    self.messages.append(Message(dumps(tool_call)))
                     result = self.call_function(name, parameters)
                     self.messages.append(
                         Message(logger.log(f"OBSERVATION: {result}", "yellow"))
@@ -106,70 +158,51 @@ class APISandboxAgent(BaseSandboxAgent):
 
     def get_tools(self):
         """Get the available tools"""
-        from os_computer_use.sandbox_agent import tools
-
+        # The registry dict is shared, so tools added by @tool still show up
         return tools
 
     def run_with_tracking(self, instruction):
         """
         Run the agent with action tracking for API usage
         """
+        for _ in self.iter_with_tracking(instruction):
+            pass
+
+        return self.tracked_actions, self.task_completed, self.completion_reason
+
+    def iter_with_tracking(self, instruction):
+        """
+        Run the agent with action tracking, yielding each tracked action as
+        soon as it is taken. Completion status is left in self.task_completed
+        and the reason the run stopped in self.completion_reason
+        """
         self.tracked_actions = []
-        completed = False
+        self.task_completed = False
+        self.completion_reason = "unknown"
         stop_detected = False
         max_iterations = 20  # Prevent infinite loops
         iteration_count = 0
 
-        # Override call_function to track actions and detect completion
-        original_call_function = self.call_function
-
-        def tracked_call_function(name, arguments):
-            nonlocal stop_detected
-            result = original_call_function(name, arguments)
-
-            action_data = {
-                "action": name,
-                "parameters": arguments,
-                "result": result,
-                "timestamp": datetime.now().isoformat(),
-            }
-
-            # Check if this is a stop action
-            if name == "stop":
-                stop_detected = True
-                action_data["completed"] = True
-
-            self.tracked_actions.append(action_data)
-            return result
-
-        self.call_function = tracked_call_function
-
         try:
             # Add the instruction to messages
-            self.messages.append(Message(f"OBJECTIVE: {instruction}"))
+            self.objective_message = Message(f"OBJECTIVE: {instruction}")
+            self.messages.append(self.objective_message)
             logger.log(f"USER: {instruction}", print=False)
+            self.last_instruction = instruction
 
             should_continue = True
             while should_continue and iteration_count < max_iterations:
                 iteration_count += 1
 
-                # Stop the sandbox from timing out - increase to 30 minutes
-                self.sandbox.set_timeout(1800)
+                # Stop the sandbox from timing out
+                self.keep_sandbox_alive()
+
+                # Describe the screen before assembling the prompt around it
+                screen_thought = f"THOUGHT: {self.append_screenshot()}"
+                logger.log(screen_thought, "green")
 
                 content, tool_calls = action_model.call(
-                    [
-                        Message(
-                            "You are an AI assistant with computer use abilities.",
-                            role="system",
-                        ),
-                        *self.messages,
-                        Message(
-                            logger.log(f"THOUGHT: {self.append_screenshot()}", "green")
-                        ),
-                        Message(
-                            "I will now use tool calls to take these actions, or use the stop command if the objective is complete.",
-                        ),
-                    ],
+                    self.build_prompt(screen_thought, MULTI_STEP_PROMPT),
                     self.get_tools(),
                 )
 
@@ -188,20 +221,31 @@ class APISandboxAgent(BaseSandboxAgent):
                         stop_detected = True
                         break
                     # Print the tool-call in an easily readable format
-                    logger.log(f"ACTION: {name} {str(parameters)}", "red")
+                    logger.log(f"ACTION: {name} {parameters}", "red")
                     # Write the tool-call to the message history using the same format used by the model
-                    self.messages.append(Message(json.dumps(tool_call)))
+                    self.messages.append(Message(dumps(tool_call)))
                     result = self.call_function(name, parameters)
+                    action_data = {
+                        "action": name,
+                        "parameters": parameters,
+                        "result": result,
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                    self.tracked_actions.append(action_data)
 
                     self.messages.append(
                         Message(logger.log(f"OBSERVATION: {result}", "yellow"))
                     )
+                    yield action_data
 
             # Determine completion status
-            completed = stop_detected
+            self.task_completed = stop_detected
+            if stop_detected:
+                self.completion_reason = "stop_tool_called"
 
             # If we hit max iterations without stop, mark as incomplete
             if iteration_count >= max_iterations and not stop_detected:
+                self.completion_reason = "max_iterations_reached"
                 self.tracked_actions.append(
                     {
                         "action": "timeout",
@@ -211,9 +255,11 @@ class APISandboxAgent(BaseSandboxAgent):
                         "completed": False,
                     }
                 )
+                yield self.tracked_actions[-1]
 
         except Exception as e:
-            completed = False
+            self.task_completed = False
+            self.completion_reason = "error_occurred"
             self.tracked_actions.append(
                 {
                     "action": "error",
@@ -223,8 +269,4 @@ class APISandboxAgent(BaseSandboxAgent):
                     "completed": False,
                 }
             )
-        finally:
-            # Restore original function
-            self.call_function = original_call_function
-
-        return self.tracked_actions, completed
+            yield self.tracked_actions[-1]
@@ -5,12 +5,62 @@ Extends APISandboxAgent with demo-specific capabilities for GitHub repo demos vi
 
 from os_computer_use.api_agent import APISandboxAgent
 from os_computer_use.logging import logger
-from os_computer_use.demo_setup_script import DemoSetupScript
+from os_computer_use.demo_setup_script import DemoSetupScript, repo_name_from_url
+from os_computer_use.demo_config import DemoConfig
 from datetime import datetime
+from functools import lru_cache
 import re
+import time
 import asyncio
 from typing import Dict, List, Optional, Tuple
 
+# URL formats accepted for a demo session
+GITHUB_URL_PREFIX = "https://github.com/"
+MEET_URL_PREFIX = "https://meet.google.com/"
+GITHUB_URL_RE = DemoConfig.GITHUB_URL_RE
+MEET_URL_RE = DemoConfig.MEET_URL_RE
+
+# URLs embedded in a step instruction
+GITHUB_URL_SEARCH_RE = re.compile(r"https://github\.com/[^\s]+")
+MEET_URL_SEARCH_RE = re.compile(r"https://meet\.google\.com/[^\s]+")
+
+# Recovery suggestions reported when a demo step fails
+RECOVERY_SUGGESTIONS = {
+    "clone_repository": (
+        "Check internet connectivity",
+        "Verify repository exists and is public",
+        "Try cloning with --depth=1 flag",
+    ),
+    "join_meet_call": (
+        "Check Meet link validity",
+        "Verify browser permissions",
+        "Try refreshing the page",
+    ),
+    "start_screen_share": (
+        "Check browser screen share permissions",
+        "Try using a different browser",
+        "Manually grant screen share access",
+    ),
+}
+DEFAULT_RECOVERY_SUGGESTIONS = (
+    "Take screenshot to analyze current state",
+    "Retry the step with modified approach",
+    "Skip to next step if non-critical",
+)
+
+
+@lru_cache(maxsize=128)
+def find_invalid_demo_input(github_url: str, meet_link: str) -> Optional[str]:
+    """Describe the first invalid demo input, or None if both are valid"""
+    # Reject the wrong host with a prefix check before running the regexes
+    if not (
+        github_url.startswith(GITHUB_URL_PREFIX) and GITHUB_URL_RE.match(github_url)
+    ):
+        return f"Invalid GitHub URL format: {github_url}"
+    if not (meet_link.startswith(MEET_URL_PREFIX) and MEET_URL_RE.match(meet_link)):
+        return f"Invalid Google Meet URL format: {meet_link}"
+    return None
+
 
 class DemoAgent(APISandboxAgent):
     """
@@ -18,10 +68,20 @@ class DemoAgent(APISandboxAgent):
     Extends APISandboxAgent with demo-specific capabilities
     """
 
+    # Updated steps - script handles initial setup, agent handles interaction
+    DEMO_STEPS = (
+        "run_setup_script",  # Script handles: terminal, clone, navigate, code viewer, browser
+        "navigate_to_meet",  # Agent: Navigate to Meet URL in browser
+        "join_meet_call",  # Agent: Join the Google Meet
+        "start_screen_share",  # Agent: Start screen sharing
+        "wait_for_instructions",  # Agent: Wait for further instructions
+    )
+
     def __init__(self, sandbox, output_dir=".", save_logs=True):
         super().__init__(sandbox, output_dir, save_logs)
         self.demo_session_id = None
         self.demo_start_time = None
+        self.demo_start_monotonic = None  # For runtime, unaffected by clock jumps
         self.current_step = None
         self.demo_progress = {
             "total_steps": 5,  # Reduced from 8 since script handles setup
@@ -29,14 +89,8 @@ class DemoAgent(APISandboxAgent):
             "current_step_index": 0,
             "status": "initialized",
         }
-        # Updated steps - script handles initial setup, agent handles interaction
-        self.demo_steps = [
-            "run_setup_script",  # Script handles: terminal, clone, navigate, code viewer, browser
-            "navigate_to_meet",  # Agent: Navigate to Meet URL in browser
-            "join_meet_call",  # Agent: Join the Google Meet
-            "start_screen_share",  # Agent: Start screen sharing
-            "wait_for_instructions",  # Agent: Wait for further instructions
-        ]
+        # Set mirror of completed_steps for membership checks
+        self.completed_step_names = set()
         self.setup_script = DemoSetupScript(sandbox)
 
     def initialize_demo_session(self, github_url: str, meet_link: str) -> str:
@@ -55,9 +109,10 @@ class DemoAgent(APISandboxAgent):
             raise ValueError("Invalid GitHub URL or Meet link provided")
 
         # Generate session ID
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.demo_session_id = f"demo_{timestamp}"
         self.demo_start_time = datetime.now()
+        self.demo_start_monotonic = time.monotonic()
+        timestamp = self.demo_start_time.strftime("%Y%m%d_%H%M%S")
+        self.demo_session_id = f"demo_{timestamp}"
 
         # Reset progress tracking
         self.demo_progress = {
@@ -70,6 +125,7 @@ class DemoAgent(APISandboxAgent):
             "session_id": self.demo_session_id,
             "start_time": self.demo_start_time.isoformat(),
         }
+        self.completed_step_names = set()
 
         logger.log(f"Demo session initialized: {self.demo_session_id}", "green")
         logger.log(f"GitHub URL: {github_url}", "blue")
@@ -88,16 +144,10 @@ class DemoAgent(APISandboxAgent):
         Returns:
             True if both inputs are valid
         """
-        # Validate GitHub URL format
-        github_pattern = r"https://github\.com/[\w\-\.]+/[\w\-\.]+/?(?:\.git)?$"
-        if not re.match(github_pattern, github_url):
-            logger.log(f"Invalid GitHub URL format: {github_url}", "red")
-            return False
-
-        # Validate Google Meet URL format
-        meet_pattern = r"https://meet\.google\.com/[a-z]{3}-[a-z]{4}-[a-z]{3}$"
-        if not re.match(meet_pattern, meet_link):
-            logger.log(f"Invalid Google Meet URL format: {meet_link}", "red")
+        # Cached, since retries tend to resend the same pair of URLs
+        error = find_invalid_demo_input(github_url, meet_link)
+        if error:
+            logger.log(error, "red")
             return False
 
         return True
@@ -109,6 +159,9 @@ class DemoAgent(APISandboxAgent):
         Returns:
             VNC stream URL for real-time monitoring
         """
+        if self.sandbox and hasattr(self.sandbox, "get_stream_url"):
+            # Memoized on the sandbox, so status polls skip the SDK call
+            return self.sandbox.get_stream_url()
         if self.sandbox and hasattr(self.sandbox, "stream"):
             return self.sandbox.stream.get_url()
         return None
@@ -120,8 +173,8 @@ class DemoAgent(APISandboxAgent):
         Returns:
             Dictionary containing progress information
         """
-        if self.demo_start_time:
-            runtime_seconds = (datetime.now() - self.demo_start_time).total_seconds()
+        if self.demo_start_monotonic is not None:
+            runtime_seconds = time.monotonic() - self.demo_start_monotonic
             runtime_minutes = runtime_seconds / 60
         else:
             runtime_minutes = 0
@@ -137,6 +190,7 @@ class DemoAgent(APISandboxAgent):
             "github_url": self.demo_progress.get("github_url"),
             "meet_link": self.demo_progress.get("meet_link"),
             "start_time": self.demo_progress.get("start_time"),
+            "setup_tasks": self.demo_progress.get("setup_tasks"),
         }
 
     def mark_step_completed(self, step_name: str, success: bool = True) -> None:
@@ -147,7 +201,8 @@ class DemoAgent(APISandboxAgent):
             step_name: Name of the completed step
             success: Whether the step completed successfully
         """
-        if success and step_name not in self.demo_progress["completed_steps"]:
+        if success and step_name not in self.completed_step_names:
+            self.completed_step_names.add(step_name)
             self.demo_progress["completed_steps"].append(step_name)
             self.demo_progress["current_step_index"] = len(
                 self.demo_progress["completed_steps"]
@@ -168,11 +223,7 @@ class DemoAgent(APISandboxAgent):
         Returns:
             Repository name for directory navigation
         """
-        # Remove .git suffix and extract repo name
-        repo_name = github_url.rstrip("/").split("/")[-1]
-        if repo_name.endswith(".git"):
-            repo_name = repo_name[:-4]
-        return repo_name
+        return repo_name_from_url(github_url)
 
     def is_demo_complete(self) -> bool:
         """
@@ -194,8 +245,8 @@ class DemoAgent(APISandboxAgent):
             Next step name or None if demo is complete
         """
         current_index = len(self.demo_progress["completed_steps"])
-        if current_index < len(self.demo_steps):
-            return self.demo_steps[current_index]
+        if current_index < len(self.DEMO_STEPS):
+            return self.DEMO_STEPS[current_index]
         return None
 
     def handle_demo_error(self, step_name: str, error: Exception) -> Dict:
@@ -213,35 +264,12 @@ class DemoAgent(APISandboxAgent):
             "step": step_name,
             "error": str(error),
             "timestamp": datetime.now().isoformat(),
-            "recovery_suggestions": [],
+            # Copied so callers can extend the report
+            "recovery_suggestions": list(
+                RECOVERY_SUGGESTIONS.get(step_name, DEFAULT_RECOVERY_SUGGESTIONS)
+            ),
         }
 
-        # Add specific recovery suggestions based on step
-        if step_name == "clone_repository":
-            error_report["recovery_suggestions"] = [
-                "Check internet connectivity",
-                "Verify repository exists and is public",
-                "Try cloning with --depth=1 flag",
-            ]
-        elif step_name == "join_meet_call":
-            error_report["recovery_suggestions"] = [
-                "Check Meet link validity",
-                "Verify browser permissions",
-                "Try refreshing the page",
-            ]
-        elif step_name == "start_screen_share":
-            error_report["recovery_suggestions"] = [
-                "Check browser screen share permissions",
-                "Try using a different browser",
-                "Manually grant screen share access",
-            ]
-        else:
-            error_report["recovery_suggestions"] = [
-                "Take screenshot to analyze current state",
-                "Retry the step with modified approach",
-                "Skip to next step if non-critical",
-            ]
-
         logger.log(f"Demo error in {step_name}: {error}", "red")
         return error_report
 
@@ -261,6 +289,7 @@ class DemoAgent(APISandboxAgent):
         # Reset session state
         self.demo_session_id = None
         self.demo_start_time = None
+        self.demo_start_monotonic = None
         self.current_step = None
 
         logger.log("Demo session cleanup completed", "green")
@@ -280,10 +309,8 @@ class DemoAgent(APISandboxAgent):
         # Handle setup script step differently
         if step_name == "run_setup_script":
             # Extract URLs from instruction
-            import re
-
-            github_url_match = re.search(r"https://github\.com/[^\s]+", instruction)
-            meet_url_match = re.search(r"https://meet\.google\.com/[^\s]+", instruction)
+            github_url_match = GITHUB_URL_SEARCH_RE.search(instruction)
+            meet_url_match = MEET_URL_SEARCH_RE.search(instruction)
 
             if not github_url_match:
                 return {
@@ -318,17 +345,10 @@ class DemoAgent(APISandboxAgent):
         result = self.execute_single_step(instruction)
 
         # Add a brief pause for command completion
-        import time
-
         time.sleep(2)
 
-        # Take a verification screenshot
-        try:
-            screenshot_data = self.screenshot()
-            logger.log("📸 Verification screenshot taken", "gray")
-        except Exception as e:
-            logger.log(f"Failed to take verification screenshot: {e}", "yellow")
-
+        # No verification screenshot: every step below is verified manually,
+        # and the next step captures the screen anyway
         # Enhanced verification based on step type
         if step_name == "navigate_to_meet":
             # For navigation to Meet, check if browser shows Google Meet
@@ -370,6 +390,10 @@ class DemoAgent(APISandboxAgent):
         return result
 
     def run_setup_script(self, github_url: str, meet_link: str) -> Dict:
+        """Run the automated setup script from synchronous code"""
+        return asyncio.run(self.run_setup_script_async(github_url, meet_link))
+
+    async def run_setup_script_async(self, github_url: str, meet_link: str) -> Dict:
         """
         Run the automated setup script to handle basic tasks
 
@@ -391,14 +415,26 @@ class DemoAgent(APISandboxAgent):
 
         try:
             # Run the setup script
-            setup_results = self.setup_script.run_full_setup(github_url, meet_link)
+            # Publish each task as it finishes so progress polls see it
+            setup_tasks = self.demo_progress["setup_tasks"] = {}
+            async for task, succeeded in self.setup_script.iter_full_setup_async(
+                github_url, meet_link
+            ):
+                setup_tasks[task] = succeeded
+                logger.log(
+                    f"Setup task {'completed' if succeeded else 'failed'}: {task}",
+                    "green" if succeeded else "red",
+                )
+            setup_results = self.setup_script.summarize_setup(setup_tasks)
 
             if setup_results["ready_for_agent"]:
                 logger.log("✅ Setup script completed successfully!", "green")
                 logger.log("🤖 Environment ready for AI agent interaction", "blue")
 
                 # Mark setup tasks as completed
-                self.demo_progress["completed_steps"].extend(["run_setup_script"])
+                if "run_setup_script" not in self.completed_step_names:
+                    self.completed_step_names.add("run_setup_script")
+                    self.demo_progress["completed_steps"].append("run_setup_script")
 
                 return {
                     "success": True,
@@ -4,7 +4,10 @@ Timeout settings, retry configurations, and environment-specific options
 """
 
 import os
-from typing import Dict, Any
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 
 class DemoConfig:
@@ -29,6 +32,9 @@ class DemoConfig:
     MAX_RETRIES_PER_STEP = 3
     RETRY_DELAY_SECONDS = 2
     ERROR_RETRY_DELAY_SECONDS = 5
+    # Steps whose failures are usually a wrong click, retried sooner
+    FAST_RETRY_STEPS = frozenset({"navigate_to_meet", "start_screen_share"})
+    FAST_RETRY_DELAY_SECONDS = 0.5
 
     # Sandbox settings
     SANDBOX_TIMEOUT_SECONDS = 1800  # 30 minutes
@@ -40,10 +46,12 @@ class DemoConfig:
 
     # GitHub repository validation
     GITHUB_URL_PATTERN = r"https://github\.com/[\w\-\.]+/[\w\-\.]+/?(?:\.git)?$"
+    GITHUB_URL_RE = re.compile(GITHUB_URL_PATTERN)
     ALLOWED_GITHUB_HOSTS = ["github.com"]
 
     # Google Meet validation
     MEET_URL_PATTERN = r"https://meet\.google\.com/[a-z]{3}-[a-z]{4}-[a-z]{3}$"
+    MEET_URL_RE = re.compile(MEET_URL_PATTERN)
     ALLOWED_MEET_HOSTS = ["meet.google.com"]
 
     # Browser preferences (in order of preference)
@@ -62,7 +70,7 @@ class DemoConfig:
 
     # Error handling
     CONTINUE_ON_NON_CRITICAL_ERRORS = True
-    CRITICAL_STEPS = ["clone_repository", "join_meet_call"]  # These must succeed
+    CRITICAL_STEPS = frozenset({"clone_repository", "join_meet_call"})  # Must succeed
 
     # UI element detection timeouts
     ELEMENT_WAIT_TIMEOUT = 10  # seconds
@@ -93,19 +101,24 @@ class DemoConfig:
         """
         return cls.STEP_TIMEOUTS.get(step_name, 60)  # Default 1 minute
 
+    # The get_*_config mappings are built on first use, after the environment
+    # overrides at the bottom of this module, and shared read-only
     @classmethod
-    def get_retry_config(cls) -> Dict[str, int]:
+    @lru_cache(maxsize=1)
+    def get_retry_config(cls) -> Mapping[str, int]:
         """
         Get retry configuration
 
         Returns:
             Dictionary with retry settings
         """
-        return {
-            "max_retries": cls.MAX_RETRIES_PER_STEP,
-            "retry_delay": cls.RETRY_DELAY_SECONDS,
-            "error_delay": cls.ERROR_RETRY_DELAY_SECONDS,
-        }
+        return MappingProxyType(
+            {
+                "max_retries": cls.MAX_RETRIES_PER_STEP,
+                "retry_delay": cls.RETRY_DELAY_SECONDS,
+                "error_delay": cls.ERROR_RETRY_DELAY_SECONDS,
+            }
+        )
 
     @classmethod
     def is_critical_step(cls, step_name: str) -> bool:
@@ -121,65 +134,85 @@ class DemoConfig:
         return step_name in cls.CRITICAL_STEPS
 
     @classmethod
-    def get_browser_config(cls) -> Dict[str, Any]:
+    @lru_cache(maxsize=1)
+    def get_browser_config(cls) -> Mapping[str, Any]:
         """
         Get browser-related configuration
 
         Returns:
             Browser configuration dictionary
         """
-        return {
-            "preferred_browsers": cls.PREFERRED_BROWSERS,
-            "timeout": cls.get_step_timeout("open_browser"),
-            "retry_attempts": cls.ELEMENT_RETRY_ATTEMPTS,
-        }
+        return MappingProxyType(
+            {
+                "preferred_browsers": cls.PREFERRED_BROWSERS,
+                "timeout": cls.get_step_timeout("open_browser"),
+                "retry_attempts": cls.ELEMENT_RETRY_ATTEMPTS,
+            }
+        )
 
     @classmethod
-    def get_git_config(cls) -> Dict[str, Any]:
+    @lru_cache(maxsize=1)
+    def get_git_config(cls) -> Mapping[str, Any]:
         """
         Get git-related configuration
 
         Returns:
             Git configuration dictionary
         """
-        return {
-            "clone_timeout": cls.CLONE_TIMEOUT_SECONDS,
-            "network_timeout": cls.NETWORK_TIMEOUT_SECONDS,
-            "retry_attempts": cls.MAX_RETRIES_PER_STEP,
-            "depth_limit": 1,  # Use shallow clone for speed
-        }
+        return MappingProxyType(
+            {
+                "clone_timeout": cls.CLONE_TIMEOUT_SECONDS,
+                "network_timeout": cls.NETWORK_TIMEOUT_SECONDS,
+                "retry_attempts": cls.MAX_RETRIES_PER_STEP,
+                "depth_limit": 1,  # Use shallow clone for speed
+            }
+        )
 
     @classmethod
-    def get_meet_config(cls) -> Dict[str, Any]:
+    @lru_cache(maxsize=1)
+    def get_meet_config(cls) -> Mapping[str, Any]:
         """
         Get Google Meet related configuration
 
         Returns:
             Meet configuration dictionary
         """
-        return {
-            "join_timeout": cls.get_step_timeout("join_meet_call"),
-            "screen_share_timeout": cls.get_step_timeout("start_screen_share"),
-            "screen_share_wait": cls.SCREEN_SHARE_WAIT_TIME,
-            "retry_attempts": cls.SCREEN_SHARE_RETRY_ATTEMPTS,
-        }
+        return MappingProxyType(
+            {
+                "join_timeout": cls.get_step_timeout("join_meet_call"),
+                "screen_share_timeout": cls.get_step_timeout("start_screen_share"),
+                "screen_share_wait": cls.SCREEN_SHARE_WAIT_TIME,
+                "retry_attempts": cls.SCREEN_SHARE_RETRY_ATTEMPTS,
+            }
+        )
 
     @classmethod
-    def get_validation_config(cls) -> Dict[str, Any]:
+    @lru_cache(maxsize=1)
+    def get_validation_config(cls) -> Mapping[str, Any]:
         """
         Get validation configuration
 
         Returns:
             Validation configuration dictionary
         """
-        return {
-            "validate_steps": cls.VALIDATE_EACH_STEP,
-            "screenshot_on_error": cls.SCREENSHOT_ON_ERROR,
-            "github_pattern": cls.GITHUB_URL_PATTERN,
-            "meet_pattern": cls.MEET_URL_PATTERN,
-            "allowed_github_hosts": cls.ALLOWED_GITHUB_HOSTS,
-            "allowed_meet_hosts": cls.ALLOWED_MEET_HOSTS,
-        }
+        return MappingProxyType(
+            {
+                "validate_steps": cls.VALIDATE_EACH_STEP,
+                "screenshot_on_error": cls.SCREENSHOT_ON_ERROR,
+                "github_pattern": cls.GITHUB_URL_PATTERN,
+                "meet_pattern": cls.MEET_URL_PATTERN,
+                "github_re": cls.GITHUB_URL_RE,
+                "meet_re": cls.MEET_URL_RE,
+                "allowed_github_hosts": cls.ALLOWED_GITHUB_HOSTS,
+                "allowed_meet_hosts": cls.ALLOWED_MEET_HOSTS,
+            }
+        )
+
+
+# Deployment environment, read once since it does not change at runtime
+_ENVIRONMENT = os.getenv("ENVIRONMENT", "development").lower()
+_IS_PRODUCTION = _ENVIRONMENT == "production"
+_IS_DEVELOPMENT = _ENVIRONMENT == "development"
 
 
 # Environment-specific overrides
@@ -191,12 +224,12 @@ class DemoEnvironment:
     @staticmethod
     def is_production() -> bool:
         """Check if running in production environment"""
-        return os.getenv("ENVIRONMENT", "development").lower() == "production"
+        return _IS_PRODUCTION
 
     @staticmethod
     def is_development() -> bool:
         """Check if running in development environment"""
-        return os.getenv("ENVIRONMENT", "development").lower() == "development"
+        return _IS_DEVELOPMENT
 
     @classmethod
     def get_config_overrides(cls) -> Dict[str, Any]:
@@ -4,27 +4,262 @@ Handles retries, error recovery, and progress tracking for demo sessions
 """
 
 import asyncio
-from datetime import datetime
+import re
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from os_computer_use.demo_agent import DemoAgent
-from os_computer_use.demo_prompts import DemoPrompts
-from os_computer_use.hybrid_demo_prompts import HybridDemoPrompts
 from os_computer_use.demo_config import DemoConfig
 from os_computer_use.logging import logger
 
 
+def regex_indicator_matcher(indicators):
+    """Build a function checking whether any indicator occurs in a text"""
+    pattern = re.compile("|".join(map(re.escape, indicators)))
+    return lambda text: pattern.search(text) is not None
+
+
+try:
+    # pyahocorasick finds any of a step's indicators in a single pass
+    import ahocorasick
+
+    def ahocorasick_indicator_matcher(indicators):
+        """Build a function checking whether any indicator occurs in a text"""
+        automaton = ahocorasick.Automaton()
+        for indicator in indicators:
+            automaton.add_word(indicator, indicator)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+
+    indicator_matcher = ahocorasick_indicator_matcher
+except ImportError:
+    ahocorasick_indicator_matcher = None
+    indicator_matcher = regex_indicator_matcher
+
+
+# Execution log entries kept per orchestrator; older ones are dropped
+MAX_EXECUTION_LOG_ENTRIES = 256
+
+# Result text indicating that a demo step succeeded
+STEP_INDICATORS = {
+    # Hybrid approach steps
+    "navigate_to_meet": (
+        "meet.google.com",
+        "google meet",
+        "join",
+        "meeting",
+        "navigated",
+        "loaded",
+    ),
+    "join_meet_call": (
+        "joined",
+        "meeting",
+        "participants",
+        "in call",
+        "camera",
+        "microphone",
+        "present",
+    ),
+    "start_screen_share": ("sharing", "screen", "present", "presenting", "shared"),
+    # Legacy steps for the old approach (fallback)
+    "open_terminal": ("terminal", "command prompt", "shell", "$", "user@", "opened"),
+    "open_code_viewer": (
+        "code",
+        "vs code",
+        "vscode",
+        "opened",
+        "files",
+        "listed",
+        "editor",
+    ),
+    "open_browser": ("browser", "firefox", "chrome", "opened", "launched", "web"),
+    "wait_for_instructions": ("waiting", "ready", "complete", "active"),
+}
+DEFAULT_INDICATORS = ("success", "complete", "done", "finished", "opened", "started")
+
+# Matchers built once from the indicators above
+STEP_MATCHERS = {
+    step_name: indicator_matcher(indicators)
+    for step_name, indicators in STEP_INDICATORS.items()
+}
+DEFAULT_MATCHER = indicator_matcher(DEFAULT_INDICATORS)
+
+# Indicators for the clone and navigate steps, depending on how they ran
+CLONE_COMMAND_MATCHER = indicator_matcher(
+    (
+        "cloning into",
+        "clone",
+        "done",
+        "complete",
+        "success",
+        "receiving objects",
+        "resolving deltas",
+    )
+)
+CLONE_TYPED_MATCHER = indicator_matcher(
+    ("cloning", "clone", "typed", "entered", "pressed")
+)
+CLONE_OTHER_MATCHER = indicator_matcher(
+    ("cloning", "clone", "done", "complete", "success")
+)
+NAVIGATE_TYPED_MATCHER = indicator_matcher(
+    ("changed", "directory", "moved", "cd", "typed", "pressed")
+)
+NAVIGATE_OTHER_MATCHER = indicator_matcher(("changed", "directory", "moved", "cd"))
+# Output showing that a cd command run by run_command failed
+NAVIGATE_ERROR_MATCHER = indicator_matcher(("error", "not found"))
+
+# Actions the agent uses when it types a command instead of running it
+TYPING_ACTIONS = ("type_text", "send_key")
+
+
+def parameters_contain(result: Dict, text: str) -> bool:
+    """Check whether a step's tool call parameters contain the text"""
+    parameters = result.get("parameters") or {}
+    if isinstance(parameters, dict):
+        return any(
+            isinstance(value, str) and text in value for value in parameters.values()
+        )
+    return text in str(parameters)
+
+
+def validate_clone_repository(result: Dict, result_text: str) -> bool:
+    """Git clone is successful if we see cloning indicators"""
+    action = result.get("action", "")
+    # Also check if run_command was used (more reliable than typing)
+    if action == "run_command" and parameters_contain(result, "git clone"):
+        # run_command was used, check output
+        return CLONE_COMMAND_MATCHER(result_text)
+    elif action in TYPING_ACTIONS or result.get("follow_up_action"):
+        # Manual typing was used, but we may have auto-pressed Enter
+        # Check if we typed a git clone command
+        if (
+            parameters_contain(result, "git clone")
+            or result.get("follow_up_action") == "send_key"
+        ):
+            # We typed a git clone command and pressed Enter, check for directory creation
+            # This is more reliable than checking command output for manual typing
+            return True  # Let verification step handle detailed checking
+        # Check output for any cloning indicators
+        return CLONE_TYPED_MATCHER(result_text)
+    else:
+        # Other actions
+        return CLONE_OTHER_MATCHER(result_text)
+
+
+def validate_navigate_to_repo(result: Dict, result_text: str) -> bool:
+    """Navigation successful if directory changed"""
+    action = result.get("action", "")
+    if action == "run_command" and parameters_contain(result, "cd "):
+        # run_command cd should complete without error
+        return not NAVIGATE_ERROR_MATCHER(result_text)
+    elif action in TYPING_ACTIONS or result.get("follow_up_action"):
+        # Manual typing was used, check if we typed cd command and pressed Enter
+        if (
+            parameters_contain(result, "cd ")
+            or result.get("follow_up_action") == "send_key"
+        ):
+            # We typed cd command and pressed Enter
+            return True  # Let verification step handle detailed checking
+        return NAVIGATE_TYPED_MATCHER(result_text)
+    else:
+        return NAVIGATE_OTHER_MATCHER(result_text)
+
+
+# Prompts only depend on the step and the demo URLs, which stay fixed for a
+# demo, so retries reuse the formatted prompt. Each prompt module is only
+# imported once its approach is used.
+@lru_cache(maxsize=64)
+def hybrid_step_prompt(step_name: str, github_url: str, meet_link: str) -> str:
+    """Get the hybrid approach prompt for a demo step"""
+    from os_computer_use.hybrid_demo_prompts import HybridDemoPrompts
+
+    return HybridDemoPrompts.get_prompts_for_step(
+        step_name, github_url=github_url, meet_link=meet_link
+    )
+
+
+@lru_cache(maxsize=64)
+def legacy_step_prompt(
+    step_name: str, github_url: str, meet_link: str, repo_name: str
+) -> str:
+    """Get the original approach prompt for a demo step"""
+    from os_computer_use.demo_prompts import DemoPrompts
+
+    return DemoPrompts.get_step_prompt(
+        step_name, github_url=github_url, meet_link=meet_link, repo_name=repo_name
+    )
+
+
+# Steps validated by a function rather than by indicators alone
+STEP_VALIDATORS = {
+    "clone_repository": validate_clone_repository,
+    "navigate_to_repo": validate_navigate_to_repo,
+}
+
+
 class DemoOrchestrator:
     """
     Manages the sequential execution of demo steps
     Handles retries, error recovery, and progress tracking
     """
 
+    # Demo steps with description templates, formatted with the demo URLs
+    HYBRID_DEMO_STEPS = (
+        ("run_setup_script", "Run setup script for {github_url} and {meet_link}"),
+        ("navigate_to_meet", "Navigate to Google Meet: {meet_link}"),
+        ("join_meet_call", "Join the Google Meet call"),
+        ("start_screen_share", "Start screen sharing"),
+        ("wait_for_instructions", "Wait for further instructions"),
+    )
+    LEGACY_DEMO_STEPS = (
+        ("open_terminal", "Open terminal application"),
+        ("clone_repository", "Clone repository: {github_url}"),
+        ("navigate_to_repo", "Navigate to repository directory"),
+        ("open_code_viewer", "Open code viewer (VS Code or file listing)"),
+        ("open_browser", "Open web browser"),
+        ("join_meet_call", "Join Google Meet: {meet_link}"),
+        ("start_screen_share", "Start screen sharing"),
+        ("wait_for_instructions", "Wait for further instructions"),
+    )
+
+    # Orchestrators are long-lived, one per running demo; keep them compact
+    __slots__ = (
+        "agent",
+        "execute_step",
+        "max_retries",
+        "log_info",
+        "step_timeout",
+        "execution_log",
+        "logged_steps",
+        "successful_steps",
+        "started_at",
+        "started_ns",
+        "current_step_start_ns",
+        "use_hybrid_approach",
+    )
+
     def __init__(self, agent: DemoAgent):
         self.agent = agent
+        # Execute steps with verification if the agent supports it
+        self.execute_step = getattr(agent, "execute_step_with_verification", None) or (
+            lambda instruction, step_name: agent.execute_single_step(instruction)
+        )
         self.max_retries = DemoConfig.MAX_RETRIES_PER_STEP
+        # Progress messages are info level; skip formatting them when the
+        # configured log level would hide them
+        self.log_info = DemoConfig.LOG_LEVEL.upper() in ("DEBUG", "INFO")
         self.step_timeout = 180  # 3 minutes per step
-        self.execution_log = []
-        self.current_step_start_time = None
+        # Log entries carry time.monotonic_ns() readings, formatted as ISO
+        # timestamps only when the log is read
+        self.execution_log = deque(maxlen=MAX_EXECUTION_LOG_ENTRIES)
+        self.logged_steps = 0  # Entries ever logged, including dropped ones
+        self.successful_steps = 0
+        self.started_at = datetime.now()
+        self.started_ns = time.monotonic_ns()
+        self.current_step_start_ns = None
         self.use_hybrid_approach = True  # Use hybrid setup script + agent approach
 
     async def run_full_demo(self, github_url: str, meet_link: str) -> Dict:
@@ -41,34 +276,25 @@ class DemoOrchestrator:
         try:
             # Initialize demo session
             session_id = self.agent.initialize_demo_session(github_url, meet_link)
-            logger.log(f"Starting full demo execution: {session_id}", "blue")
-
-            # Execute each step in sequence with hybrid approach
-            if self.use_hybrid_approach:
-                demo_steps = [
-                    (
-                        "run_setup_script",
-                        f"Run setup script for {github_url} and {meet_link}",
-                    ),
-                    ("navigate_to_meet", f"Navigate to Google Meet: {meet_link}"),
-                    ("join_meet_call", "Join the Google Meet call"),
-                    ("start_screen_share", "Start screen sharing"),
-                    ("wait_for_instructions", "Wait for further instructions"),
-                ]
-            else:
-                # Original approach (fallback)
-                demo_steps = [
-                    ("open_terminal", "Open terminal application"),
-                    ("clone_repository", f"Clone repository: {github_url}"),
-                    ("navigate_to_repo", f"Navigate to repository directory"),
-                    ("open_code_viewer", "Open code viewer (VS Code or file listing)"),
-                    ("open_browser", "Open web browser"),
-                    ("join_meet_call", f"Join Google Meet: {meet_link}"),
-                    ("start_screen_share", "Start screen sharing"),
-                    ("wait_for_instructions", "Wait for further instructions"),
-                ]
-
-            for step_name, step_description in demo_steps:
+            if self.log_info:
+                logger.log(f"Starting full demo execution: {session_id}", "blue")
+
+            # Execute each step in sequence with hybrid approach, or the
+            # original approach as a fallback. Steps cannot overlap: each
+            # agent step acts on the screen the previous step left behind,
+            # and navigating to Meet needs the browser the setup script
+            # opens. The setup script runs its own independent tasks
+            # concurrently.
+            demo_steps = (
+                self.HYBRID_DEMO_STEPS
+                if self.use_hybrid_approach
+                else self.LEGACY_DEMO_STEPS
+            )
+
+            for step_name, description_template in demo_steps:
+                step_description = description_template.format(
+                    github_url=github_url, meet_link=meet_link
+                )
                 success = await self.execute_step_with_retry(
                     step_name, step_description, github_url, meet_link
                 )
@@ -79,9 +305,11 @@ class DemoOrchestrator:
 
                 # Check if we should continue
                 if step_name == "wait_for_instructions":
-                    logger.log(
-                        "Demo setup complete - waiting for user instructions", "green"
-                    )
+                    if self.log_info:
+                        logger.log(
+                            "Demo setup complete - waiting for user instructions",
+                            "green",
+                        )
                     break
 
             # Generate final summary
@@ -92,7 +320,7 @@ class DemoOrchestrator:
             return {
                 "success": False,
                 "error": str(e),
-                "execution_log": self.execution_log,
+                "execution_log": self.get_execution_log(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -111,33 +339,36 @@ class DemoOrchestrator:
         Returns:
             True if step completed successfully
         """
-        self.current_step_start_time = datetime.now()
+        self.current_step_start_ns = time.monotonic_ns()
         self.agent.current_step = step_name
 
         for attempt in range(1, self.max_retries + 1):
+            attempt_started = time.monotonic()
             try:
-                logger.log(
-                    f"Executing step {step_name} (attempt {attempt}/{self.max_retries})",
-                    "blue",
-                )
+                if self.log_info:
+                    logger.log(
+                        f"Executing step {step_name} (attempt {attempt}/{self.max_retries})",
+                        "blue",
+                    )
 
                 # Get step-specific instruction
                 instruction = self._get_step_instruction(
                     step_name, github_url, meet_link
                 )
 
-                # Execute step with verification
-                if hasattr(self.agent, "execute_step_with_verification"):
-                    result = self.agent.execute_step_with_verification(
-                        instruction, step_name
-                    )
-                else:
-                    result = self.agent.execute_single_step(instruction)
+                # Execute step, off the event loop since steps block on the
+                # model and the sandbox
+                result = await asyncio.to_thread(
+                    self.execute_step, instruction, step_name
+                )
 
-                # Check verification result
-                verification_success = result.get("verification") == "success"
-                step_completed = result.get("completed", False)
-                validation_success = self._validate_step_success(step_name, result)
+                # Check verification result, validating the result text only
+                # when the step did not already report success
+                step_success = (
+                    result.get("completed", False)
+                    or result.get("verification") == "success"
+                    or self._validate_step_success(step_name, result)
+                )
 
                 # Log step execution
                 step_log = {
@@ -146,25 +377,18 @@ class DemoOrchestrator:
                     "attempt": attempt,
                     "instruction": instruction,
                     "result": result,
-                    "timestamp": datetime.now().isoformat(),
-                    "success": step_completed
-                    or verification_success
-                    or validation_success,
+                    "timestamp_ns": time.monotonic_ns(),
+                    "success": step_success,
                 }
 
-                self.execution_log.append(step_log)
+                self.record_step(step_log)
 
                 # Check if step completed successfully
                 if step_log["success"]:
                     self.agent.mark_step_completed(step_name, True)
-                    logger.log(f"Step {step_name} completed successfully", "green")
+                    if self.log_info:
+                        logger.log(f"Step {step_name} completed successfully", "green")
                     return True
-                elif result.get("action") == "stop":
-                    # If AI thinks task is done but we haven't validated success
-                    if self._validate_step_success(step_name, result):
-                        self.agent.mark_step_completed(step_name, True)
-                        logger.log(f"Step {step_name} completed (validated)", "green")
-                        return True
 
                 # Step failed, prepare for retry
                 logger.log(
@@ -173,7 +397,13 @@ class DemoOrchestrator:
                 )
 
                 if attempt < self.max_retries:
-                    await asyncio.sleep(2)  # Brief pause before retry
+                    # Brief pause before retry, shorter for steps that fail fast
+                    delay = (
+                        DemoConfig.FAST_RETRY_DELAY_SECONDS
+                        if step_name in DemoConfig.FAST_RETRY_STEPS
+                        else DemoConfig.RETRY_DELAY_SECONDS
+                    )
+                    await self.wait_before_retry(delay, attempt_started)
 
             except Exception as e:
                 error_report = self.agent.handle_demo_error(step_name, e)
@@ -182,14 +412,17 @@ class DemoOrchestrator:
                     "description": step_description,
                     "attempt": attempt,
                     "error": error_report,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp_ns": time.monotonic_ns(),
                     "success": False,
                 }
-                self.execution_log.append(step_log)
+                self.record_step(step_log)
 
                 if attempt < self.max_retries:
                     logger.log(f"Retrying step {step_name} after error: {e}", "yellow")
-                    await asyncio.sleep(5)  # Longer pause after error
+                    # Longer pause after error
+                    await self.wait_before_retry(
+                        DemoConfig.ERROR_RETRY_DELAY_SECONDS, attempt_started
+                    )
                 else:
                     logger.log(
                         f"Step {step_name} failed after {self.max_retries} attempts",
@@ -200,6 +433,18 @@ class DemoOrchestrator:
         self.agent.mark_step_completed(step_name, False)
         return False
 
+    async def wait_before_retry(self, delay: float, attempt_started: float) -> None:
+        """
+        Pause before retrying a step, counting time the attempt already took
+
+        Args:
+            delay: Minimum seconds between the start of attempts
+            attempt_started: time.monotonic() reading when the attempt began
+        """
+        remaining = delay - (time.monotonic() - attempt_started)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
     def _get_step_instruction(
         self, step_name: str, github_url: str, meet_link: str
     ) -> str:
@@ -216,18 +461,11 @@ class DemoOrchestrator:
         """
         if self.use_hybrid_approach:
             # Use hybrid prompts for new approach
-            return HybridDemoPrompts.get_prompts_for_step(
-                step_name, github_url=github_url, meet_link=meet_link
-            )
+            return hybrid_step_prompt(step_name, github_url, meet_link)
         else:
             # Fallback to original prompts
             repo_name = self.agent.extract_repo_name(github_url)
-            return DemoPrompts.get_step_prompt(
-                step_name,
-                github_url=github_url,
-                meet_link=meet_link,
-                repo_name=repo_name,
-            )
+            return legacy_step_prompt(step_name, github_url, meet_link, repo_name)
 
     def _validate_step_success(self, step_name: str, result: Dict) -> bool:
         """
@@ -240,212 +478,24 @@ class DemoOrchestrator:
         Returns:
             True if step appears to have succeeded
         """
-        action = result.get("action", "")
-        result_text = str(result.get("result", "")).lower()
-
         # Check if the agent explicitly said it was completed
         if result.get("completed", False):
             return True
 
-        # Handle new hybrid approach steps
+        # Setup script success is determined by the script itself
         if step_name == "run_setup_script":
-            # Setup script success is determined by the script itself
             return result.get("verification") == "success"
 
-        elif step_name == "navigate_to_meet":
-            # Navigation to Meet successful if we see meet-related content
-            return any(
-                indicator in result_text
-                for indicator in [
-                    "meet.google.com",
-                    "google meet",
-                    "join",
-                    "meeting",
-                    "navigated",
-                    "loaded",
-                ]
-            )
-
-        elif step_name == "join_meet_call":
-            # Meeting join successful if we see meeting interface
-            return any(
-                indicator in result_text
-                for indicator in [
-                    "joined",
-                    "meeting",
-                    "participants",
-                    "in call",
-                    "camera",
-                    "microphone",
-                    "present",
-                ]
-            )
-
-        elif step_name == "start_screen_share":
-            # Screen sharing successful if we see sharing interface
-            return any(
-                indicator in result_text
-                for indicator in [
-                    "sharing",
-                    "screen",
-                    "present",
-                    "presenting",
-                    "shared",
-                ]
-            )
-
-        # Legacy validation for old approach (fallback)
-        elif step_name == "open_terminal":
-            # Terminal is open if we see terminal-related indicators
-            return any(
-                indicator in result_text
-                for indicator in [
-                    "terminal",
-                    "command prompt",
-                    "shell",
-                    "$",
-                    "user@",
-                    "opened",
-                ]
-            )
-
-        elif step_name == "clone_repository":
-            # Git clone is successful if we see cloning indicators
-            # Also check if run_command was used (more reliable than typing)
-            if action == "run_command" and "git clone" in str(
-                result.get("parameters", {})
-            ):
-                # run_command was used, check output
-                return any(
-                    indicator in result_text
-                    for indicator in [
-                        "cloning into",
-                        "clone",
-                        "done",
-                        "complete",
-                        "success",
-                        "receiving objects",
-                        "resolving deltas",
-                    ]
-                )
-            elif action in ["type_text", "send_key"] or result.get("follow_up_action"):
-                # Manual typing was used, but we may have auto-pressed Enter
-                # Check if we typed a git clone command
-                parameters = result.get("parameters", {})
-                if (
-                    "git clone" in str(parameters)
-                    or result.get("follow_up_action") == "send_key"
-                ):
-                    # We typed a git clone command and pressed Enter, check for directory creation
-                    # This is more reliable than checking command output for manual typing
-                    return True  # Let verification step handle detailed checking
-                # Check output for any cloning indicators
-                return any(
-                    indicator in result_text
-                    for indicator in ["cloning", "clone", "typed", "entered", "pressed"]
-                )
-            else:
-                # Other actions
-                return any(
-                    indicator in result_text
-                    for indicator in ["cloning", "clone", "done", "complete", "success"]
-                )
-
-        elif step_name == "navigate_to_repo":
-            # Navigation successful if directory changed
-            if action == "run_command" and "cd " in str(result.get("parameters", {})):
-                # run_command cd should complete without error
-                return "error" not in result_text and "not found" not in result_text
-            elif action in ["type_text", "send_key"] or result.get("follow_up_action"):
-                # Manual typing was used, check if we typed cd command and pressed Enter
-                parameters = result.get("parameters", {})
-                if (
-                    "cd " in str(parameters)
-                    or result.get("follow_up_action") == "send_key"
-                ):
-                    # We typed cd command and pressed Enter
-                    return True  # Let verification step handle detailed checking
-                return any(
-                    indicator in result_text
-                    for indicator in [
-                        "changed",
-                        "directory",
-                        "moved",
-                        "cd",
-                        "typed",
-                        "pressed",
-                    ]
-                )
-            else:
-                return any(
-                    indicator in result_text
-                    for indicator in ["changed", "directory", "moved", "cd"]
-                )
-
-        elif step_name == "open_code_viewer":
-            return any(
-                indicator in result_text
-                for indicator in [
-                    "code",
-                    "vs code",
-                    "vscode",
-                    "opened",
-                    "files",
-                    "listed",
-                    "editor",
-                ]
-            )
-
-        elif step_name == "open_browser":
-            return any(
-                indicator in result_text
-                for indicator in [
-                    "browser",
-                    "firefox",
-                    "chrome",
-                    "opened",
-                    "launched",
-                    "web",
-                ]
-            )
-
-        elif step_name == "join_meet_call":
-            return any(
-                indicator in result_text
-                for indicator in [
-                    "meet",
-                    "joined",
-                    "call",
-                    "connected",
-                    "guest",
-                    "video",
-                ]
-            )
-
-        elif step_name == "start_screen_share":
-            return any(
-                indicator in result_text
-                for indicator in ["screen", "sharing", "present", "share", "started"]
-            )
+        result_text = str(result.get("result", "")).lower()
 
-        elif step_name == "wait_for_instructions":
-            return any(
-                indicator in result_text
-                for indicator in ["waiting", "ready", "complete", "active"]
-            )
+        # Steps whose outcome depends on more than the result text
+        validator = STEP_VALIDATORS.get(step_name)
+        if validator:
+            return validator(result, result_text)
 
-        # Default: look for general success indicators
-        return any(
-            indicator in result_text
-            for indicator in [
-                "success",
-                "complete",
-                "done",
-                "finished",
-                "opened",
-                "started",
-            ]
-        )
+        # Other steps succeed if the result mentions one of their indicators,
+        # falling back to general success indicators
+        return STEP_MATCHERS.get(step_name, DEFAULT_MATCHER)(result_text)
 
     def log_step_completion(self, step: str, success: bool, details: str) -> None:
         """
@@ -456,23 +506,49 @@ class DemoOrchestrator:
             success: Whether step succeeded
             details: Additional details about the step execution
         """
+        now_ns = time.monotonic_ns()
         log_entry = {
             "step": step,
             "success": success,
             "details": details,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": now_ns,
             "duration_seconds": None,
         }
 
-        if self.current_step_start_time:
-            duration = (datetime.now() - self.current_step_start_time).total_seconds()
+        if self.current_step_start_ns is not None:
+            duration = (now_ns - self.current_step_start_ns) / 1e9
             log_entry["duration_seconds"] = round(duration, 2)
 
-        self.execution_log.append(log_entry)
-        logger.log(
-            f"Step logged: {step} - {'Success' if success else 'Failed'}",
-            "green" if success else "red",
-        )
+        self.record_step(log_entry)
+        if self.log_info or not success:
+            logger.log(
+                f"Step logged: {step} - {'Success' if success else 'Failed'}",
+                "green" if success else "red",
+            )
+
+    def record_step(self, entry: Dict) -> None:
+        """Append an entry to the execution log and update the step counts"""
+        self.logged_steps += 1
+        if entry.get("success", False):
+            self.successful_steps += 1
+        self.execution_log.append(entry)
+
+    def get_execution_log(self) -> List[Dict]:
+        """
+        Get the execution log with ISO timestamps
+
+        Returns:
+            Copies of the log entries, each with a timestamp
+        """
+        execution_log = []
+        for entry in self.execution_log:
+            entry = dict(entry)
+            elapsed_ns = entry.pop("timestamp_ns") - self.started_ns
+            entry["timestamp"] = (
+                self.started_at + timedelta(microseconds=elapsed_ns / 1000)
+            ).isoformat()
+            execution_log.append(entry)
+        return execution_log
 
     def get_execution_summary(self) -> Dict:
         """
@@ -481,10 +557,8 @@ class DemoOrchestrator:
         Returns:
             Summary of the demo execution
         """
-        total_steps = len(self.execution_log)
-        successful_steps = sum(
-            1 for log in self.execution_log if log.get("success", False)
-        )
+        total_steps = self.logged_steps
+        successful_steps = self.successful_steps
 
         return {
             "session_id": self.agent.demo_session_id,
@@ -494,7 +568,7 @@ class DemoOrchestrator:
             "completion_rate": round(
                 (successful_steps / total_steps * 100) if total_steps > 0 else 0, 1
             ),
-            "execution_log": self.execution_log,
+            "execution_log": self.get_execution_log(),
             "progress_status": self.agent.get_progress_status(),
             "sandbox_url": self.agent.get_sandbox_url(),
             "timestamp": datetime.now().isoformat(),
@@ -3,6 +3,26 @@ Demo Prompts - Optimized prompts for each demo step
 Includes fallback prompts and error recovery instructions
 """
 
+from string import Formatter
+from typing import Dict, Optional, Tuple
+
+
+def parse_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a str.format template into (literal text, field name) segments"""
+    return tuple(
+        (literal, field) for literal, field, _, _ in Formatter().parse(template)
+    )
+
+
+def render_template(
+    segments: Tuple[Tuple[str, Optional[str]], ...], values: Dict
+) -> str:
+    """Join template segments, leaving fields missing from values empty"""
+    return "".join(
+        literal if field is None else literal + str(values.get(field, ""))
+        for literal, field in segments
+    )
+
 
 class DemoPrompts:
     """
@@ -50,6 +70,14 @@ You are currently working with GUI applications. Focus on:
 - Recognizing application states and windows"""
     )
 
+    # System prompt for each context
+    SYSTEM_PROMPTS = {
+        "base": SYSTEM_PROMPT_BASE,
+        "terminal": SYSTEM_PROMPT_TERMINAL,
+        "browser": SYSTEM_PROMPT_BROWSER,
+        "gui": SYSTEM_PROMPT_GUI,
+    }
+
     # Step-specific detailed prompts
     TERMINAL_PROMPT = """Open the terminal application on this desktop.
 
@@ -286,6 +314,23 @@ Maintain this state and respond to any additional instructions for the demonstra
         """,
     }
 
+    # Prompts for steps without placeholders, returned as they are
+    STATIC_STEP_PROMPTS = {
+        "open_terminal": TERMINAL_PROMPT,
+        "open_code_viewer": CODE_VIEWER_PROMPT,
+        "open_browser": BROWSER_PROMPT,
+        "start_screen_share": SCREEN_SHARE_PROMPT,
+        "wait_for_instructions": WAIT_PROMPT,
+    }
+
+    # Templates for the remaining steps, parsed once so rendering only fills
+    # in the fields
+    STEP_PROMPT_TEMPLATES = {
+        "clone_repository": parse_template(GIT_CLONE_PROMPT_TEMPLATE),
+        "navigate_to_repo": parse_template(NAVIGATION_PROMPT_TEMPLATE),
+        "join_meet_call": parse_template(MEET_JOIN_PROMPT_TEMPLATE),
+    }
+
     @classmethod
     def get_step_prompt(cls, step_name: str, **kwargs) -> str:
         """
@@ -298,24 +343,15 @@ Maintain this state and respond to any additional instructions for the demonstra
         Returns:
             Formatted prompt string
         """
-        prompt_map = {
-            "open_terminal": cls.TERMINAL_PROMPT,
-            "clone_repository": cls.GIT_CLONE_PROMPT_TEMPLATE.format(
-                github_url=kwargs.get("github_url", "")
-            ),
-            "navigate_to_repo": cls.NAVIGATION_PROMPT_TEMPLATE.format(
-                repo_name=kwargs.get("repo_name", "")
-            ),
-            "open_code_viewer": cls.CODE_VIEWER_PROMPT,
-            "open_browser": cls.BROWSER_PROMPT,
-            "join_meet_call": cls.MEET_JOIN_PROMPT_TEMPLATE.format(
-                meet_link=kwargs.get("meet_link", "")
-            ),
-            "start_screen_share": cls.SCREEN_SHARE_PROMPT,
-            "wait_for_instructions": cls.WAIT_PROMPT,
-        }
-
-        return prompt_map.get(step_name, f"Execute step: {step_name}")
+        prompt = cls.STATIC_STEP_PROMPTS.get(step_name)
+        if prompt is not None:
+            return prompt
+
+        segments = cls.STEP_PROMPT_TEMPLATES.get(step_name)
+        if segments is None:
+            return f"Execute step: {step_name}"
+
+        return render_template(segments, kwargs)
 
     @classmethod
     def get_system_prompt(cls, context: str = "base") -> str:
@@ -328,14 +364,7 @@ Maintain this state and respond to any additional instructions for the demonstra
         Returns:
             System prompt string
         """
-        prompt_map = {
-            "base": cls.SYSTEM_PROMPT_BASE,
-            "terminal": cls.SYSTEM_PROMPT_TERMINAL,
-            "browser": cls.SYSTEM_PROMPT_BROWSER,
-            "gui": cls.SYSTEM_PROMPT_GUI,
-        }
-
-        return prompt_map.get(context, cls.SYSTEM_PROMPT_BASE)
+        return cls.SYSTEM_PROMPTS.get(context, cls.SYSTEM_PROMPT_BASE)
 
     @classmethod
     def get_recovery_prompt(cls, error_type: str) -> str:
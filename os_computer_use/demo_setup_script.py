@@ -14,13 +14,42 @@ The AI agent then takes over for interactive tasks:
 - Interact with participants
 """
 
+import asyncio
 import os
+import shlex
 import sys
 import subprocess
+import threading
 import time
 import webbrowser
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, Tuple
+
+# Setup tasks in the order they are reported
+SETUP_TASKS = (
+    "open_terminal",
+    "clone_repository",
+    "navigate_to_repo",
+    "open_code_viewer",
+    "open_browser",
+)
+
+# Terminal color coding for different log statuses
+STATUS_COLORS = {
+    "info": "\033[94m",  # Blue
+    "success": "\033[92m",  # Green
+    "warning": "\033[93m",  # Yellow
+    "error": "\033[91m",  # Red
+}
+RESET_COLOR = "\033[0m"
+
+
+@lru_cache(maxsize=32)
+def repo_name_from_url(github_url: str) -> str:
+    """Get the directory name git clone uses for a repository URL"""
+    # Take the last path segment and drop any .git suffix
+    return github_url.rstrip("/").rsplit("/", 1)[-1].removesuffix(".git")
 
 
 class DemoSetupScript:
@@ -29,26 +58,20 @@ class DemoSetupScript:
     def __init__(self, sandbox):
         self.sandbox = sandbox
         self.setup_log = []
+        # Setup tasks log from several worker threads at once
+        self.log_lock = threading.Lock()
 
     def log(self, message: str, status: str = "info"):
         """Log a message with timestamp"""
-        timestamp = time.strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
-        self.setup_log.append(
-            {"message": message, "status": status, "timestamp": timestamp}
-        )
-
-        # Color coding for different statuses
-        colors = {
-            "info": "\033[94m",  # Blue
-            "success": "\033[92m",  # Green
-            "warning": "\033[93m",  # Yellow
-            "error": "\033[91m",  # Red
-            "reset": "\033[0m",  # Reset
-        }
+        color = STATUS_COLORS.get(status, STATUS_COLORS["info"])
 
-        color = colors.get(status, colors["info"])
-        print(f"{color}{log_entry}{colors['reset']}")
+        # Keep the setup log and the console output in the same order
+        with self.log_lock:
+            timestamp = time.strftime("%H:%M:%S")
+            self.setup_log.append(
+                {"message": message, "status": status, "timestamp": timestamp}
+            )
+            print(f"{color}[{timestamp}] {message}{RESET_COLOR}")
 
     def run_command(self, command: str, timeout: int = 30) -> Dict[str, Any]:
         """Run a command in the sandbox and return result"""
@@ -83,16 +106,14 @@ class DemoSetupScript:
         """Clone the GitHub repository reliably"""
         self.log("🔄 Starting repository clone...")
 
-        # Extract repository name from URL
-        repo_name = github_url.rstrip("/").split("/")[-1]
-        if repo_name.endswith(".git"):
-            repo_name = repo_name[:-4]
+        repo_name = repo_name_from_url(github_url)
+        repo_dir = shlex.quote(repo_name)
 
         # Check if directory already exists
-        ls_result = self.run_command("ls -la")
-        if repo_name in ls_result.get("stdout", ""):
+        exists_result = self.run_command(f"test -d {repo_dir} && echo Y || echo N")
+        if exists_result.get("stdout", "").strip() == "Y":
             self.log(f"⚠️ Directory {repo_name} already exists, removing...", "warning")
-            self.run_command(f"rm -rf {repo_name}")
+            self.run_command(f"rm -rf {repo_dir}")
 
         # Clone the repository
         clone_result = self.run_command(f"git clone {github_url}", timeout=60)
@@ -104,22 +125,13 @@ class DemoSetupScript:
             )
             return False
 
-        # Verify the clone worked
-        ls_result = self.run_command("ls -la")
-        if repo_name not in ls_result.get("stdout", ""):
-            self.log(
-                f"❌ Repository directory {repo_name} not found after clone", "error"
-            )
-            return False
-
+        # git clone only exits successfully once the repository directory exists
         self.log(f"✅ Successfully cloned repository: {repo_name}", "success")
         return True
 
     def navigate_to_repository(self, github_url: str) -> bool:
         """Navigate to the cloned repository directory"""
-        repo_name = github_url.rstrip("/").split("/")[-1]
-        if repo_name.endswith(".git"):
-            repo_name = repo_name[:-4]
+        repo_name = repo_name_from_url(github_url)
 
         self.log(f"📁 Navigating to repository: {repo_name}")
 
@@ -158,9 +170,7 @@ class DemoSetupScript:
 
     def open_code_viewer(self, github_url: str) -> bool:
         """Open code viewer (try VS Code, fallback to file listing)"""
-        repo_name = github_url.rstrip("/").split("/")[-1]
-        if repo_name.endswith(".git"):
-            repo_name = repo_name[:-4]
+        repo_name = repo_name_from_url(github_url)
 
         self.log("📝 Opening code viewer...")
 
@@ -192,6 +202,7 @@ class DemoSetupScript:
         self.log("🌐 Opening browser to Google Meet...")
 
         # First, try to open Firefox
+        browser_process = "firefox"
         firefox_result = self.run_command("firefox --new-window 'about:blank' &")
 
         if not firefox_result["success"]:
@@ -199,10 +210,12 @@ class DemoSetupScript:
             self.log("⚠️ Firefox not available, trying other browsers", "warning")
 
             # Try Chrome/Chromium
+            browser_process = "chrome"
             chrome_result = self.run_command(
                 "google-chrome --new-window 'about:blank' &"
             )
             if not chrome_result["success"]:
+                browser_process = "chromium"
                 chromium_result = self.run_command(
                     "chromium-browser --new-window 'about:blank' &"
                 )
@@ -211,7 +224,8 @@ class DemoSetupScript:
                     return False
 
         # Wait for browser to start
-        time.sleep(3)
+        if not self.wait_for_process(browser_process):
+            self.log("⚠️ Browser process not detected yet, continuing", "warning")
 
         self.log(
             f"✅ Browser opened - ready for agent to navigate to: {meet_link}",
@@ -219,17 +233,83 @@ class DemoSetupScript:
         )
         return True
 
+    def wait_for_process(
+        self, name: str, attempts: int = 15, interval: float = 0.2
+    ) -> bool:
+        """
+        Wait until a process matching name is running in the sandbox
+
+        The polling runs inside the sandbox, so it takes one round trip and
+        returns as soon as the process shows up.
+        """
+        # Bracket the first letter so pgrep does not match this shell itself
+        pattern = shlex.quote(f"[{name[0]}]{name[1:]}")
+        result = self.run_command(
+            f"for i in $(seq {attempts}); do "
+            f"pgrep -f {pattern} > /dev/null && exit 0; sleep {interval}; "
+            "done; exit 1",
+            timeout=int(attempts * interval) + 10,
+        )
+        return result["success"]
+
     def run_full_setup(self, github_url: str, meet_link: str) -> Dict[str, Any]:
+        """Run the complete setup process from synchronous code"""
+        return asyncio.run(self.run_full_setup_async(github_url, meet_link))
+
+    async def run_full_setup_async(
+        self, github_url: str, meet_link: str
+    ) -> Dict[str, Any]:
         """
         Run the complete setup process
 
         Returns:
             Dictionary with setup results and status
         """
+        task_results = {}
+        async for task, succeeded in self.iter_full_setup_async(github_url, meet_link):
+            task_results[task] = succeeded
+        return self.summarize_setup(task_results)
+
+    async def iter_full_setup_async(
+        self, github_url: str, meet_link: str
+    ) -> AsyncIterator[Tuple[str, bool]]:
+        """
+        Run the setup tasks, yielding (task, succeeded) as each one finishes
+
+        The terminal check, the repository tasks and the browser launch are
+        independent, so they run concurrently in worker threads. The
+        repository tasks stay in order since each needs the clone.
+        """
         self.log("🚀 Starting demo setup script...", "info")
         self.log(f"📦 GitHub URL: {github_url}", "info")
         self.log(f"📹 Meet URL: {meet_link}", "info")
 
+        finished = asyncio.Queue()
+
+        async def run_task(task, func, *args):
+            try:
+                succeeded = await asyncio.to_thread(func, *args)
+            except Exception as e:
+                self.log(f"❌ Setup task {task} error: {e}", "error")
+                succeeded = False
+            finished.put_nowait((task, succeeded))
+
+        async def prepare_repository():
+            await run_task("clone_repository", self.clone_repository, github_url)
+            await run_task("navigate_to_repo", self.navigate_to_repository, github_url)
+            await run_task("open_code_viewer", self.open_code_viewer, github_url)
+
+        tasks = asyncio.gather(
+            run_task("open_terminal", self.open_terminal),
+            prepare_repository(),
+            run_task("open_browser", self.open_browser_to_meet, meet_link),
+        )
+        for _ in range(len(SETUP_TASKS)):
+            yield await finished.get()
+        await tasks
+
+    def summarize_setup(self, task_results: Dict[str, bool]) -> Dict[str, Any]:
+        """Build the setup results from the outcome of each task"""
         results = {
             "overall_success": True,
             "completed_tasks": [],
@@ -238,40 +318,15 @@ class DemoSetupScript:
             "ready_for_agent": False,
         }
 
-        # Task 1: Open terminal
-        if self.open_terminal():
-            results["completed_tasks"].append("open_terminal")
-        else:
-            results["failed_tasks"].append("open_terminal")
-            results["overall_success"] = False
-
-        # Task 2: Clone repository
-        if self.clone_repository(github_url):
-            results["completed_tasks"].append("clone_repository")
-        else:
-            results["failed_tasks"].append("clone_repository")
-            results["overall_success"] = False
-
-        # Task 3: Navigate to repository
-        if self.navigate_to_repository(github_url):
-            results["completed_tasks"].append("navigate_to_repo")
-        else:
-            results["failed_tasks"].append("navigate_to_repo")
-            results["overall_success"] = False
-
-        # Task 4: Open code viewer
-        if self.open_code_viewer(github_url):
-            results["completed_tasks"].append("open_code_viewer")
-        else:
-            results["failed_tasks"].append("open_code_viewer")
-            # Not critical, continue
-
-        # Task 5: Open browser
-        if self.open_browser_to_meet(meet_link):
-            results["completed_tasks"].append("open_browser")
-        else:
-            results["failed_tasks"].append("open_browser")
-            results["overall_success"] = False
+        # Report tasks in setup order, whichever finished first
+        for task in SETUP_TASKS:
+            if task_results.get(task):
+                results["completed_tasks"].append(task)
+            else:
+                results["failed_tasks"].append(task)
+                # The code viewer is not critical, continue without it
+                if task != "open_code_viewer":
+                    results["overall_success"] = False
 
         # Summary
         if results["overall_success"]:
@@ -5,7 +5,16 @@ from PIL import Image
 import io
 import json
 import re
-import base64
+
+try:
+    # pybase64 is a SIMD base64 codec that can encode straight to str
+    from pybase64 import b64encode_as_string
+except ImportError:
+    import base64
+
+    def b64encode_as_string(data):
+        # Base64 output is pure ASCII, which decodes faster than UTF-8
+        return base64.b64encode(data).decode("ascii")
 
 
 def Message(content, role="assistant"):
@@ -84,12 +93,16 @@ class LLMProvider:
         else:
             return message
 
+    # Wrap all blocks in the messages of a request
+    def transform_messages(self, messages):
+        return [self.transform_message(message) for message in messages]
+
     # Create a chat completion using the API client
     def completion(self, messages, **kwargs):
         # Skip the tools parameter if it's None
         filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
         # Wrap content blocks in image or text objects if necessary
-        new_messages = [self.transform_message(message) for message in messages]
+        new_messages = self.transform_messages(messages)
         # Call the inference provider
         completion = self.client.create(
             messages=new_messages, model=self.model, **filtered_kwargs
@@ -129,7 +142,7 @@ class OpenAIBaseProvider(LLMProvider):
             print(f"Error detecting image type: {e}")
 
         # Base64-encode the raw image bytes.
-        encoded = base64.b64encode(image_data).decode("utf-8")
+        encoded = b64encode_as_string(image_data)
         return {
             "type": "image_url",
             "image_url": {"url": f"data:image/{image_type};base64,{encoded}"},
@@ -174,6 +187,9 @@ class OpenAIBaseProvider(LLMProvider):
 
 class AnthropicBaseProvider(LLMProvider):
 
+    # Prompt caching breakpoint, reusing the processed prefix up to a block
+    cache_control = {"type": "ephemeral"}
+
     def create_client(self):
         return Anthropic(api_key=self.api_key).messages
 
@@ -198,6 +214,23 @@ class AnthropicBaseProvider(LLMProvider):
             },
         }
 
+    # Mark the end of the conversation as a cache breakpoint, so a follow-up
+    # request that extends it only re-processes the new messages
+    def transform_messages(self, messages):
+        new_messages = super().transform_messages(messages)
+        if new_messages:
+            last = new_messages[-1]
+            content = last["content"]
+            if not isinstance(content, list):
+                content = [Text(content)]
+            if content:
+                content = [
+                    *content[:-1],
+                    {**content[-1], "cache_control": self.cache_control},
+                ]
+                new_messages[-1] = {**last, "content": content}
+        return new_messages
+
     def call(self, messages, functions=None):
         tools = self.create_function_schema(functions) if functions else None
 
@@ -207,6 +240,10 @@ class AnthropicBaseProvider(LLMProvider):
         )
         messages = [msg for msg in messages if msg.get("role") != "system"]
 
+        # The tools and system prompt are identical on every call, so cache them
+        if system:
+            system = [{**Text(system), "cache_control": self.cache_control}]
+
         # Call the Anthropic API
         completion = self.completion(
             messages, system=system, tools=tools, max_tokens=4096
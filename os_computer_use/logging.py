@@ -1,4 +1,6 @@
+import atexit
 import os
+import threading
 
 
 # A logger to write to the console and a log file in color
@@ -32,9 +34,19 @@ class Logger:
 
     def __init__(self):
         self.logs = []  # Output logs
+        self.log_lines = []  # Output logs rendered as HTML, filled in by flush()
         self.log_file = None  # Output log file
         self.log_file_template = None  # Store the log file template
 
+        # The log file is rendered and rewritten by a background thread;
+        # log() only marks it dirty, so bursts of log lines coalesce into a
+        # single write and callers, including the demo orchestrator's event
+        # loop, never wait on disk I/O
+        self.log_file_dirty = threading.Event()
+        self.log_file_lock = threading.Lock()
+        self.log_file_writer = None
+        atexit.register(self.flush)
+
         # Load the HTML template when the logger is initialized
         try:
             template_path = os.path.join(
@@ -57,18 +69,35 @@ class Logger:
             # Fallback: Print the message without color
             print(message)
 
+    # Render a log entry as a line of HTML in color
+    def render_entry(self, entry):
+        color_info = self.css_color_map.get(entry["color"], (entry["color"], "#f5f5f5"))
+        return f"<p style='color:{color_info[0]};background:{color_info[1]}'>{entry['text']}</p>\n"
+
     # Write the log file in color
-    def write_log_file(self, logs, filepath):
+    def flush(self):
         """Write the complete log file using the stored log entries"""
-        content = ""
-        for entry in logs:
-            color_info = self.css_color_map.get(
-                entry["color"], (entry["color"], "#f5f5f5")
+        with self.log_file_lock:
+            filepath = self.log_file
+            if not filepath or self.log_file_template is None:
+                return
+            # Render the entries logged since the last flush
+            self.log_lines.extend(
+                map(self.render_entry, self.logs[len(self.log_lines) :])
             )
-            content += f"<p style='color:{color_info[0]};background:{color_info[1]}'>{entry['text']}</p>\n"
+            content = "".join(self.log_lines)
+            with open(filepath, "w") as f:
+                f.write(self.log_file_template.replace("{{content}}", content))
 
-        with open(filepath, "w") as f:
-            f.write(self.log_file_template.replace("{{content}}", content))
+    # Rewrite the log file whenever new lines were logged
+    def write_log_file_loop(self):
+        while True:
+            self.log_file_dirty.wait()
+            self.log_file_dirty.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Warning: Could not write log file: {e}")
 
     # Write a line to the log file and terminal
     def log(self, text, color="black", print=True):
@@ -76,9 +105,15 @@ class Logger:
         if print:
             self.print_colored(text, color)
         # Write to the log file
-        self.logs.append({"text": text, "color": color})
+        entry = {"text": text, "color": color}
+        self.logs.append(entry)
         if self.log_file:
-            self.write_log_file(self.logs, self.log_file)
+            if self.log_file_writer is None:
+                self.log_file_writer = threading.Thread(
+                    target=self.write_log_file_loop, daemon=True
+                )
+                self.log_file_writer.start()
+            self.log_file_dirty.set()
         return text
 
 
@@ -3,9 +3,12 @@ Meeting Service - Handles Google Meet operations
 Completely independent from repository functionality
 """
 
+import re
 import time
 from typing import Dict, Any, Optional
 
+MEET_URL_RE = re.compile(r"https://meet\.google\.com/[a-z]{3}-[a-z]{4}-[a-z]{3}$")
+
 
 class MeetingService:
     """
@@ -70,10 +73,7 @@ class MeetingService:
 
     def validate_meet_url(self, meet_url: str) -> bool:
         """Validate Google Meet URL format"""
-        import re
-
-        meet_pattern = r"https://meet\.google\.com/[a-z]{3}-[a-z]{4}-[a-z]{3}$"
-        if not re.match(meet_pattern, meet_url):
+        if not MEET_URL_RE.match(meet_url):
             self.log(f"❌ Invalid Google Meet URL format: {meet_url}", "error")
             return False
         return True
@@ -8,10 +8,14 @@ import os
 import tempfile
 from PIL import Image
 import json
+import time
 
 TYPING_DELAY_MS = 12
 TYPING_GROUP_SIZE = 50
 
+# Sandbox timeout, renewed once half of it has elapsed rather than every step
+SANDBOX_TIMEOUT_SECONDS = 1800
+
 tools = {
     "stop": {
         "description": "Indicate that the task has been completed.",
@@ -29,6 +33,7 @@ class SandboxAgent:
         self.latest_screenshot = None  # Most recent PNG of the screen
         self.image_counter = 0  # Current screenshot number
         self.tmp_dir = tempfile.mkdtemp()  # Folder to store screenshots
+        self.sandbox_timeout_set_at = None  # When the timeout was last renewed
 
         # Set the log file location
         if save_logs:
@@ -39,6 +44,16 @@ class SandboxAgent:
             param_str = ", ".join(details.get("params").keys())
             print(f"- {action}({param_str})")
 
+    # Push the sandbox timeout out to 30 minutes if it is due for renewal
+    def keep_sandbox_alive(self):
+        now = time.monotonic()
+        if (
+            self.sandbox_timeout_set_at is None
+            or now - self.sandbox_timeout_set_at > SANDBOX_TIMEOUT_SECONDS / 2
+        ):
+            self.sandbox.set_timeout(SANDBOX_TIMEOUT_SECONDS)
+            self.sandbox_timeout_set_at = now
+
     def call_function(self, name, arguments):
 
         func_impl = getattr(self, name.lower()) if name.lower() in tools else None
@@ -70,12 +85,13 @@ class SandboxAgent:
         return filepath
 
     def screenshot(self):
-        file = self.sandbox.screenshot()
+        # The SDK hands back a bytearray; providers expect bytes
+        file = bytes(self.sandbox.screenshot())
         filename = self.save_image(file, "screenshot")
         logger.log(f"screenshot {filename}", "gray")
         self.latest_screenshot = filename
-        with open(filename, "rb") as image_file:
-            return image_file.read()
+        # Return the grabbed PNG rather than reading the saved copy back
+        return file
 
     @tool(
         description="Run a shell command and return the result.",
@@ -169,10 +185,14 @@ class SandboxAgent:
     def right_click(self, query):
         return self.click_element(query, self.sandbox.right_click, "right click")
 
+    # Agent memory as included in model prompts
+    def history(self):
+        return self.messages
+
     def append_screenshot(self):
         return vision_model.call(
             [
-                *self.messages,
+                *self.history(),
                 Message(
                     [
                         self.screenshot(),
@@ -195,8 +215,8 @@ class SandboxAgent:
 
         should_continue = True
         while should_continue:
-            # Stop the sandbox from timing out - increase to 30 minutes
-            self.sandbox.set_timeout(1800)
+            # Stop the sandbox from timing out
+            self.keep_sandbox_alive()
 
             content, tool_calls = action_model.call(
                 [
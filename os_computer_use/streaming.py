@@ -11,6 +11,8 @@ class Sandbox(SandboxBase):
         super().__init__(*args, **kwargs)
         self.vnc_port = 5900
         self.vnc_process = None
+        self.created_at = time.monotonic()
+        self.stream_url = None
 
     def start_stream(self):
         # Start VNC server
@@ -19,6 +21,12 @@ class Sandbox(SandboxBase):
         time.sleep(2)
         return f"https://{self.get_host(self.vnc_port)}"
 
+    def get_stream_url(self):
+        # The VNC stream URL doesn't change for the lifetime of the sandbox
+        if self.stream_url is None:
+            self.stream_url = self.stream.get_url()
+        return self.stream_url
+
     def kill(self):
         # Kill the VNC server process
         if self.vnc_process:
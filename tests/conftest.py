@@ -0,0 +1,5 @@
+import os
+
+# api_server reads these at import time; API_KEY turns on authentication
+os.environ.setdefault("E2B_API_KEY", "test")
+os.environ.setdefault("API_KEY", "test-api-key")
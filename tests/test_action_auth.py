@@ -0,0 +1,41 @@
+import os
+
+os.environ.setdefault("E2B_API_KEY", "test")
+os.environ.setdefault("API_KEY", "test-api-key")
+
+from fastapi.testclient import TestClient
+
+import api_server
+
+client = TestClient(api_server.app)
+
+MALFORMED_BODY = b'{"instruction": '
+
+
+def post(path, api_key):
+    return client.post(
+        path,
+        content=MALFORMED_BODY,
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+    )
+
+
+def test_invalid_key_is_rejected_before_body_validation():
+    for path in ("/act", "/act/stream"):
+        response = post(path, "not-the-api-key")
+        assert response.status_code == 401, (path, response.text)
+
+
+def test_valid_key_still_validates_body():
+    for path in ("/act", "/act/stream"):
+        response = post(path, api_server.API_KEY)
+        assert response.status_code == 422, (path, response.text)
+
+
+if __name__ == "__main__":
+    test_invalid_key_is_rejected_before_body_validation()
+    test_valid_key_still_validates_body()
+    print("Action auth tests passed")
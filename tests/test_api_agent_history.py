@@ -0,0 +1,57 @@
+import os_computer_use.api_agent as api_agent
+import os_computer_use.sandbox_agent as sandbox_agent
+from os_computer_use.api_agent import MAX_MESSAGES, APISandboxAgent
+
+
+# This is a mock sandbox that returns a static screenshot
+class MockSandbox:
+    def screenshot(self):
+        with open("./tests/test_screenshot.png", "rb") as f:
+            return f.read()
+
+    def set_timeout(self, timeout):
+        pass
+
+
+# Model stand-ins that record the messages of their latest call
+class MockVisionModel:
+    def call(self, messages):
+        self.messages = messages
+        return "The objective is: open the browser"
+
+
+class MockActionModel:
+    def call(self, messages, tools):
+        self.messages = messages
+        return "Clicking", [{"name": "wait", "parameters": {}}]
+
+
+def objective_messages(messages):
+    return [
+        message
+        for message in messages
+        if message["content"] == "OBJECTIVE: Open the browser"
+    ]
+
+
+def test_objective_survives_trimmed_history():
+    vision_model = sandbox_agent.vision_model = MockVisionModel()
+    action_model = api_agent.action_model = MockActionModel()
+    agent = APISandboxAgent(MockSandbox(), save_logs=False)
+
+    # Each step adds three messages, so the objective is trimmed off
+    for _ in range(MAX_MESSAGES):
+        agent.execute_single_step("Open the browser")
+    assert len(agent.messages) == MAX_MESSAGES
+    assert not objective_messages(agent.messages)
+
+    # Both model calls still see the objective, ahead of the history
+    assert objective_messages(vision_model.messages)
+    assert vision_model.messages[0]["content"] == "OBJECTIVE: Open the browser"
+    assert objective_messages(action_model.messages)
+    assert action_model.messages[1]["content"] == "OBJECTIVE: Open the browser"
+
+
+if __name__ == "__main__":
+    test_objective_survives_trimmed_history()
+    print("API agent history tests passed")
@@ -0,0 +1,48 @@
+from os_computer_use.demo_prompts import DemoPrompts, parse_template, render_template
+
+TEMPLATES = {
+    "clone_repository": DemoPrompts.GIT_CLONE_PROMPT_TEMPLATE,
+    "navigate_to_repo": DemoPrompts.NAVIGATION_PROMPT_TEMPLATE,
+    "join_meet_call": DemoPrompts.MEET_JOIN_PROMPT_TEMPLATE,
+}
+
+VALUES = {
+    "github_url": "https://github.com/octocat/Hello-World.git",
+    "repo_name": "Hello-World",
+    "meet_link": "https://meet.google.com/abc-defg-hij",
+}
+
+
+def test_render_template_matches_format():
+    templates = (
+        *TEMPLATES.values(),
+        "{{escaped}} {github_url} twice: {github_url}",
+        "no placeholders",
+        "",
+    )
+    for template in templates:
+        segments = parse_template(template)
+        assert render_template(segments, VALUES) == template.format(**VALUES)
+        # Missing values render as empty strings
+        empty = dict.fromkeys(VALUES, "")
+        assert render_template(segments, {}) == template.format(**empty)
+
+
+def test_get_step_prompt_formats_templates():
+    for step_name, template in TEMPLATES.items():
+        prompt = DemoPrompts.get_step_prompt(step_name, **VALUES)
+        assert prompt == template.format(**VALUES)
+
+
+def test_get_step_prompt_returns_static_prompts():
+    for step_name, prompt in DemoPrompts.STATIC_STEP_PROMPTS.items():
+        assert "{" not in prompt
+        assert DemoPrompts.get_step_prompt(step_name, **VALUES) is prompt
+    assert DemoPrompts.get_step_prompt("unknown") == "Execute step: unknown"
+
+
+if __name__ == "__main__":
+    test_render_template_matches_format()
+    test_get_step_prompt_formats_templates()
+    test_get_step_prompt_returns_static_prompts()
+    print("Demo prompt tests passed")
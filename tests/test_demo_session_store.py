@@ -0,0 +1,63 @@
+import asyncio
+import os
+from datetime import datetime
+
+os.environ.setdefault("E2B_API_KEY", "test")
+
+from api_server import DemoSession, DemoSessionStore
+
+
+# A mock sandbox that records how many times it was killed
+class MockSandbox:
+    def __init__(self):
+        self.kills = 0
+
+    def kill(self):
+        self.kills += 1
+
+
+def make_session(demo_sandbox, status="initialized"):
+    return DemoSession(
+        agent=None,
+        sandbox=demo_sandbox,
+        orchestrator=None,
+        status=status,
+        created_at=datetime.now(),
+    )
+
+
+def test_set_status_updates_live_session():
+    demo_sandbox = MockSandbox()
+    store = DemoSessionStore(maxsize=4, ttl_seconds=60)
+
+    async def run():
+        store["a"] = make_session(demo_sandbox)
+        expires_at = store.expires_at["a"]
+        store.set_status("a", "completed")
+        assert store["a"].status == "completed"
+        assert store.expires_at["a"] == expires_at
+
+    asyncio.run(run())
+    assert demo_sandbox.kills == 0
+
+
+def test_set_status_does_not_revive_expired_session():
+    demo_sandbox = MockSandbox()
+    store = DemoSessionStore(maxsize=4, ttl_seconds=0)
+
+    async def run():
+        store["a"] = make_session(demo_sandbox)
+        store.set_status("a", "completed")
+        assert "a" not in store
+        # The failure path evicts after setting the status
+        store.evict("a")
+
+    # asyncio.run waits for the executor running the kills
+    asyncio.run(run())
+    assert demo_sandbox.kills == 1
+
+
+if __name__ == "__main__":
+    test_set_status_updates_live_session()
+    test_set_status_does_not_revive_expired_session()
+    print("DemoSessionStore tests passed")
@@ -0,0 +1,72 @@
+import itertools
+
+from os_computer_use.demo_orchestrator import (
+    DEFAULT_INDICATORS,
+    STEP_INDICATORS,
+    ahocorasick_indicator_matcher,
+    regex_indicator_matcher,
+)
+
+INDICATOR_SETS = {**STEP_INDICATORS, "default": DEFAULT_INDICATORS}
+
+# Result texts unrelated to any indicator, including near misses for the
+# indicators with regex metacharacters
+FILLER_TEXTS = (
+    "",
+    " ",
+    "the command returned no output",
+    "meetxgooglexcom",
+    "user-at-host: ~",
+    "error: repository not found",
+)
+
+
+def sample_texts():
+    """Lowercased result texts built around every known indicator"""
+    indicators = {
+        indicator
+        for indicator_set in INDICATOR_SETS.values()
+        for indicator in indicator_set
+    }
+    texts = set(FILLER_TEXTS)
+    for indicator in indicators:
+        texts.update(
+            (
+                indicator,
+                f"action result: {indicator}",
+                f"{indicator} at the start",
+                f"x{indicator}x",
+                indicator[:-1],
+                indicator[1:],
+            )
+        )
+    for first, second in itertools.permutations(sorted(indicators), 2):
+        texts.add(first + second)
+        texts.add(f"{first[:-1]} {second[1:]}")
+    return sorted(texts)
+
+
+def check_backend(build_matcher):
+    texts = sample_texts()
+    for step_name, indicators in INDICATOR_SETS.items():
+        matcher = build_matcher(indicators)
+        for text in texts:
+            expected = any(indicator in text for indicator in indicators)
+            assert matcher(text) == expected, (step_name, text)
+
+
+def test_regex_matcher_matches_substring_check():
+    check_backend(regex_indicator_matcher)
+
+
+def test_ahocorasick_matcher_matches_substring_check():
+    # pyahocorasick is optional; without it the regex matcher is used
+    if ahocorasick_indicator_matcher is None:
+        return
+    check_backend(ahocorasick_indicator_matcher)
+
+
+if __name__ == "__main__":
+    test_regex_matcher_matches_substring_check()
+    test_ahocorasick_matcher_matches_substring_check()
+    print("Indicator matcher tests passed")